@@ -1,78 +1,139 @@
 """
 Generate comprehensive Word documentation for the
 Smart Pothole Detection & Mapping System (IoT Project).
+
+Only python-docx and the standard library are imported at module level so
+the script starts quickly and can be imported without side effects; any
+optional extras (e.g. chart rendering) must be imported inside the helper
+that needs them.
 """
 
 from docx import Document
-from docx.shared import Inches, Pt, Cm, RGBColor
+from docx.shared import Pt, Cm, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 import os, datetime
 
-# ── Utility helpers ──────────────────────────────────────────────
+# ── Shared style constants (built once, reused by every helper) ──
 
-def set_cell_shading(cell, color_hex):
-    """Apply background shading to a table cell."""
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color_hex)
-    shading.set(qn('w:val'), 'clear')
-    cell._tc.get_or_add_tcPr().append(shading)
+BRAND_BLUE = RGBColor(0x1E, 0x3A, 0x5F)
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+PT_TABLE_HEADER = Pt(10)
+PT_TABLE_BODY = Pt(9)
+PT_TIGHT_SPACING = Pt(2)
 
+# ── Utility helpers ──────────────────────────────────────────────
 
-def add_formatted_table(doc, headers, rows, col_widths=None):
+def set_cell_shading(cell, color_hex, _OxmlElement=OxmlElement, _qn=qn):
+    """Apply background shading to a table cell (a _Cell or a raw <w:tc>)."""
+    shading = _OxmlElement('w:shd')
+    shading.set(_qn('w:fill'), color_hex)
+    shading.set(_qn('w:val'), 'clear')
+    tc = getattr(cell, '_tc', cell)
+    tc.get_or_add_tcPr().append(shading)
+
+
+def _run_properties(size, bold=False, color=None, _OxmlElement=OxmlElement, _qn=qn):
+    """Build a <w:rPr> element (children in schema order: b, color, sz)."""
+    rpr = _OxmlElement('w:rPr')
+    if bold:
+        rpr.append(_OxmlElement('w:b'))
+    if color is not None:
+        color_el = _OxmlElement('w:color')
+        color_el.set(_qn('w:val'), str(color))
+        rpr.append(color_el)
+    size_el = _OxmlElement('w:sz')
+    size_el.set(_qn('w:val'), str(int(size.pt * 2)))  # half-points
+    rpr.append(size_el)
+    return rpr
+
+
+def _fill_cell(tc, text, size, bold=False, color=None,
+               _OxmlElement=OxmlElement, _qn=qn):
+    """
+    Write text straight into a fresh cell's XML as a single formatted run.
+    Equivalent to setting cell.text and then styling its runs, without
+    python-docx's proxy objects and property descriptors.
+    """
+    run = _OxmlElement('w:r')
+    run.append(_run_properties(size, bold, color))
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            run.append(_OxmlElement('w:br'))
+        t = _OxmlElement('w:t')
+        t.set(_qn('xml:space'), 'preserve')
+        t.text = line
+        run.append(t)
+    tc.p_lst[0].append(run)
+
+
+def add_formatted_table(doc, headers, rows, col_widths=None,
+                        header_size=PT_TABLE_HEADER, body_size=PT_TABLE_BODY,
+                        header_color=WHITE):
     """Add a nicely formatted table to the document."""
+    # Bind hot globals locally: the cell loops below run thousands of times.
+    _Cm = Cm
+    _fill = _fill_cell
+    _shade = set_cell_shading
+
     table = doc.add_table(rows=1 + len(rows), cols=len(headers))
     table.style = 'Table Grid'
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    # Work on the underlying <w:tr>/<w:tc> elements instead of _Row/_Cell proxies
+    tr_lst = table._tbl.tr_lst
 
     # Header row
-    for i, h in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        cell.text = h
-        for p in cell.paragraphs:
-            for run in p.runs:
-                run.bold = True
-                run.font.size = Pt(10)
-                run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-        set_cell_shading(cell, '1E3A5F')
+    for tc, h in zip(tr_lst[0].tc_lst, headers):
+        _fill(tc, h, header_size, bold=True, color=header_color)
+        _shade(tc, '1E3A5F')
 
     # Data rows
     for ri, row_data in enumerate(rows):
-        for ci, val in enumerate(row_data):
-            cell = table.rows[ri + 1].cells[ci]
-            cell.text = str(val)
-            for p in cell.paragraphs:
-                for run in p.runs:
-                    run.font.size = Pt(9)
-            if ri % 2 == 1:
-                set_cell_shading(cell, 'EAF2FB')
+        striped = ri % 2 == 1
+        for tc, val in zip(tr_lst[ri + 1].tc_lst, row_data):
+            _fill(tc, str(val), body_size)
+            if striped:
+                _shade(tc, 'EAF2FB')
 
     if col_widths:
         for i, w in enumerate(col_widths):
+            width = _Cm(w)
             for row in table.rows:
-                row.cells[i].width = Cm(w)
+                row.cells[i].width = width
 
     doc.add_paragraph()  # spacing
 
 
-def add_bullet_list(doc, items, bold_prefix=False):
+def add_bullet_list(doc, items, bold_prefix=False, style=None):
     """Add a bulleted list; items can be plain strings or (bold, rest) tuples."""
+    add_paragraph = doc.add_paragraph
+    # Resolve the style once instead of by name for every item
+    if style is None:
+        style = doc.styles['List Bullet']
     for item in items:
         if isinstance(item, tuple):
-            p = doc.add_paragraph(style='List Bullet')
+            p = add_paragraph(style=style)
             run_b = p.add_run(item[0])
             run_b.bold = True
             p.add_run(item[1])
         else:
-            doc.add_paragraph(item, style='List Bullet')
+            add_paragraph(item, style=style)
 
 
 # ── Main document builder ────────────────────────────────────────
 
-def build_document():
+def build_document(force=False):
+    output_dir = os.path.join(os.path.dirname(__file__), 'Documentation')
+    output_path = os.path.join(output_dir, 'Smart_Pothole_Detection_System_Documentation.docx')
+
+    # Make-style incremental build: skip if the .docx is newer than this script
+    if not force and os.path.exists(output_path) and \
+            os.path.getmtime(output_path) >= os.path.getmtime(__file__):
+        print(f'\nDocumentation is up to date, skipping rebuild:\n   {output_path}')
+        return output_path
+
     doc = Document()
 
     # ── Global style tweaks ──
@@ -83,7 +144,7 @@ def build_document():
 
     for level in range(1, 4):
         hs = doc.styles[f'Heading {level}']
-        hs.font.color.rgb = RGBColor(0x1E, 0x3A, 0x5F)
+        hs.font.color.rgb = BRAND_BLUE
 
     # ────────────────────────────────────────────────────────────
     # COVER PAGE
@@ -96,7 +157,7 @@ def build_document():
     run = title.add_run('Smart Pothole Detection\n& Mapping System')
     run.bold = True
     run.font.size = Pt(28)
-    run.font.color.rgb = RGBColor(0x1E, 0x3A, 0x5F)
+    run.font.color.rgb = BRAND_BLUE
 
     subtitle = doc.add_paragraph()
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -146,7 +207,7 @@ def build_document():
     ]
     for t in toc_items:
         p = doc.add_paragraph(t)
-        p.paragraph_format.space_after = Pt(2)
+        p.paragraph_format.space_after = PT_TIGHT_SPACING
     doc.add_page_break()
 
     # ────────────────────────────────────────────────────────────
@@ -949,7 +1010,7 @@ def build_document():
     ]
     for i, ref in enumerate(refs, 1):
         p = doc.add_paragraph(f'[{i}]  {ref}')
-        p.paragraph_format.space_after = Pt(2)
+        p.paragraph_format.space_after = PT_TIGHT_SPACING
 
     # ────────────────────────────────────────────────────────────
     # FOOTER on every page
@@ -966,9 +1027,7 @@ def build_document():
     run_f.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
 
     # ── Save ─────────────────────────────────────────────────────
-    output_dir = os.path.join(os.path.dirname(__file__), 'Documentation')
     os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, 'Smart_Pothole_Detection_System_Documentation.docx')
     doc.save(output_path)
     print(f'\n✅ Documentation saved successfully to:\n   {output_path}')
     print(f'   File size: {os.path.getsize(output_path) / 1024:.1f} KB')
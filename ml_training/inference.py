@@ -1,30 +1,72 @@
+import functools
 import cv2
+import os
 import numpy as np
+import torch
 from ultralytics import YOLO
 
-def run_inference(image_path, model_path='pothole_detection/v1/weights/best.pt'):
+_torch_threads_configured = False
+
+
+def configure_torch_threads():
+    """
+    Use every core for conv/gemm (many Pi builds default to 1 thread) with a
+    single inter-op thread to avoid oversubscription. Safe to call repeatedly:
+    torch only accepts the inter-op setting once per process, before any
+    parallel work has started.
+    """
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    _torch_threads_configured = True
+    torch.set_num_threads(os.cpu_count() or 1)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Already set elsewhere in this process; keep that setting
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def get_model(model_path):
     """
-    Run inference on a single image using the trained YOLOv8 model.
+    Load a YOLO model once per path and reuse it across calls.
+    Also accepts exported model directories (NCNN/OpenVINO).
     """
+    configure_torch_threads()
+    model = YOLO(model_path, task='detect')
+    if model_path.endswith('.pt'):
+        # Collapse Conv+BN once at load time
+        model.fuse()
+    return model
+
+def run_inference(image_paths, model_path='pothole_detection/v1/weights/best.pt'):
+    """
+    Run inference on one or more images using the trained YOLOv8 model.
+    """
+    if isinstance(image_paths, str):
+        image_paths = [image_paths]
+
     # Load the model
-    model = YOLO(model_path)
+    model = get_model(model_path)
+    names = model.names
 
-    # Perform detection
-    results = model(image_path)
+    # Perform detection; stream=True yields results per image instead of a list
+    results = model(image_paths, stream=True)
 
     # Process results
     for result in results:
         boxes = result.boxes  # Bounding boxes
-        for box in boxes:
-            # Get coordinates, confidence, and class
-            x1, y1, x2, y2 = box.xyxy[0].tolist()
-            conf = box.conf[0].item()
-            cls = box.cls[0].item()
-            
-            print(f"Detected {model.names[int(cls)]} with confidence {conf:.2f} at [{x1}, {y1}, {x2}, {y2}]")
-            
+        # One device->host copy per image instead of per box
+        xyxy = boxes.xyxy.cpu().numpy()
+        confs = boxes.conf.cpu().numpy()
+        clss = boxes.cls.cpu().numpy().astype(int)
+        widths_px = xyxy[:, 2] - xyxy[:, 0]
+
+        for (x1, y1, x2, y2), conf, cls, width_px in zip(xyxy, confs, clss, widths_px):
+            print(f"Detected {names[cls]} with confidence {conf:.2f} at [{x1}, {y1}, {x2}, {y2}]")
+
             # Example: Calculate width in pixels
-            width_px = x2 - x1
             print(f"Pothole pixel width: {width_px:.2f}")
 
     # Show the results (optional)
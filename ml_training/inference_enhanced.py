@@ -1,53 +1,173 @@
 import cv2
+import os
+import sys
 import time
-from ultralytics import YOLO
+import numpy as np
+import torch
+import torchvision
 
-# For high accuracy on small objects, we can use SAHI-like slicing manually 
-# or use the standard YOLOv8 inference with Test-Time Augmentation (TTA)
-def enhanced_inference(image_path, model_path='pothole_detection_enhanced/v2_accurate/weights/best.pt'):
+# Make the sibling inference.py importable when run from another directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+# Shared loader: one model cache (and one torch thread setup) per process
+from inference import get_model
+
+# Tile size used for SAHI-style slicing; matches the deployment imgsz on the Pi
+TILE_SIZE = 320
+TILE_OVERLAP = 0.2
+NMS_IOU = 0.45
+# Two-scale ensemble: 320^2 + 480^2 is ~1/3 of one 640^2 pass, versus TTA's three
+ENSEMBLE_SCALES = (320, 480)
+
+
+def slice_image(img, overlap=TILE_OVERLAP):
+    """
+    Split an image into a fixed 2x2 grid of overlapping tiles (SAHI-style slicing).
+    Returns the tiles and the (x, y) offset of each tile in the original image.
+    """
+    h, w = img.shape[:2]
+    tile_w = min(w, int(np.ceil(w / (2 - overlap))))
+    tile_h = min(h, int(np.ceil(h / (2 - overlap))))
+
+    tiles, offsets = [], []
+    for y in (0, h - tile_h):
+        for x in (0, w - tile_w):
+            tiles.append(img[y:y + tile_h, x:x + tile_w])
+            offsets.append((x, y))
+    return tiles, offsets
+
+
+def downscale(img, size=TILE_SIZE):
     """
-    Run high-accuracy inference using Test-Time Augmentation (TTA) and confidence filtering.
+    Shrink an image so its longest side is `size`, keeping the aspect ratio.
+    INTER_AREA is the fastest anti-aliased filter for large downscales and leaves
+    Ultralytics' own letterbox with nothing to do but pad.
+    Returns the resized image and the scale factor applied.
     """
-    model = YOLO(model_path)
-    
-    # Run inference with TTA for higher accuracy (at the cost of speed)
-    # TTA flips and scales the image during inference to find hard-to-detect objects
+    h, w = img.shape[:2]
+    scale = size / max(h, w)
+    if scale >= 1.0:
+        return img, 1.0
+    resized = cv2.resize(img, (round(w * scale), round(h * scale)), interpolation=cv2.INTER_AREA)
+    return resized, scale
+
+
+def _tiled_detections(model, img, debug):
+    """
+    Batched predict over the 2x2 tiles; boxes are mapped back to original image
+    coordinates. Returns lists of per-tile boxes, confidences and class ids.
+    """
+    # Small tiles concentrate resolution where small potholes live; all tiles go
+    # through one batched predict call so they share a single forward pass
+    tiles, offsets = slice_image(img)
+    tiles, scales = zip(*(downscale(tile) for tile in tiles))
     results = model.predict(
-        source=image_path,
+        source=list(tiles),
+        imgsz=TILE_SIZE,
         conf=0.25,        # Confidence threshold
-        iou=0.45,         # IOU threshold for NMS
-        augment=True,     # Enable Test-Time Augmentation
-        save=True         # Save the results
+        iou=NMS_IOU,      # IOU threshold for NMS
+        save=debug,       # Annotated JPEG writes only when debugging
+        verbose=False,
+        stream=True       # Yield results instead of accumulating a list
     )
 
-    potholes_found = 0
-    for result in results:
-        boxes = result.boxes
-        for box in boxes:
-            potholes_found += 1
-            x1, y1, x2, y2 = box.xyxy[0].tolist()
-            conf = box.conf[0].item()
-            
-            # Severity mapping based on pixel area (rough estimate)
-            area = (x2 - x1) * (y2 - y1)
-            severity = "Minor" if area < 5000 else "Moderate" if area < 15000 else "Critical"
-            
-            print(f"Detection {potholes_found}:")
-            print(f"  Confidence: {conf:.4f}")
-            print(f"  Estimated Severity (Visual): {severity}")
-            print(f"  Bounding Box: [{int(x1)}, {int(y1)}, {int(x2)}, {int(y2)}]")
+    # Map tile-local boxes back to global (full-resolution) coordinates
+    all_boxes, all_scores, all_classes = [], [], []
+    for result, (dx, dy), scale in zip(results, offsets, scales):
+        tile_boxes = result.boxes.xyxy.cpu()
+        if len(tile_boxes) == 0:
+            continue
+        tile_boxes = tile_boxes / scale + torch.tensor([dx, dy, dx, dy], dtype=tile_boxes.dtype)
+        all_boxes.append(tile_boxes)
+        all_scores.append(result.boxes.conf.cpu())
+        all_classes.append(result.boxes.cls.cpu())
+    return all_boxes, all_scores, all_classes
+
+
+def _multiscale_detections(model, img, scales, debug):
+    """
+    Runs the whole image once per input size. Returns lists of per-scale boxes
+    (already in original image coordinates), confidences and class ids.
+    """
+    all_boxes, all_scores, all_classes = [], [], []
+    for imgsz in scales:
+        # Ultralytics letterboxes to imgsz and maps boxes back to the original image
+        for result in model.predict(source=img, imgsz=imgsz, conf=0.25, iou=NMS_IOU,
+                                    save=debug, verbose=False, stream=True):
+            all_boxes.append(result.boxes.xyxy.cpu())
+            all_scores.append(result.boxes.conf.cpu())
+            all_classes.append(result.boxes.cls.cpu())
+    return all_boxes, all_scores, all_classes
+
+
+# For high accuracy on small objects we use SAHI-like slicing manually instead of
+# Test-Time Augmentation (TTA), which runs the full 640px network three times
+def enhanced_inference(image_path, model_path='pothole_detection_enhanced/v2_accurate/weights/best.pt',
+                       debug=False, scales=None):
+    """
+    Run high-accuracy inference using tiled (sliced) inference and confidence filtering.
+    Returns the merged boxes (xyxy, original image coordinates) and their confidences.
+    Set debug=True to save annotated tiles to disk for visual verification.
+
+    Pass scales (e.g. ENSEMBLE_SCALES) to run a multi-scale ensemble of the whole
+    image instead of tiles. Use it with the dynamic-shape INT8 OpenVINO export
+    (best_int8_openvino_model/ from export.py); INT8 TFLite and NCNN are fixed at 320.
+    """
+    model = get_model(model_path)
+
+    img = cv2.imread(image_path)
+    if img is None:
+        raise FileNotFoundError(f"Could not read image: {image_path}")
+
+    if scales:
+        all_boxes, all_scores, all_classes = _multiscale_detections(model, img, scales, debug)
+    else:
+        all_boxes, all_scores, all_classes = _tiled_detections(model, img, debug)
+
+    if all_boxes:
+        boxes = torch.cat(all_boxes)
+        scores = torch.cat(all_scores)
+        classes = torch.cat(all_classes)
+        # Single class-aware NMS over the merged set removes duplicates from
+        # overlapping tiles or from the different scales
+        keep = torchvision.ops.batched_nms(boxes, scores, classes, NMS_IOU)
+        boxes, scores = boxes[keep], scores[keep]
+    else:
+        boxes = torch.zeros((0, 4))
+        scores = torch.zeros(0)
+
+    # Single copy to numpy, severity computed for all boxes at once
+    xyxy = boxes.numpy()
+    confs = scores.numpy()
+    # Severity mapping based on pixel area (rough estimate)
+    areas = (xyxy[:, 2] - xyxy[:, 0]) * (xyxy[:, 3] - xyxy[:, 1])
+    severities = np.where(areas < 5000, "Minor", np.where(areas < 15000, "Moderate", "Critical"))
+    potholes_found = len(xyxy)
+
+    for i, ((x1, y1, x2, y2), conf, severity) in enumerate(zip(xyxy.astype(int), confs, severities), 1):
+        print(f"Detection {i}:")
+        print(f"  Confidence: {conf:.4f}")
+        print(f"  Estimated Severity (Visual): {severity}")
+        print(f"  Bounding Box: [{x1}, {y1}, {x2}, {y2}]")
 
     print(f"\nTotal potholes detected: {potholes_found}")
-    return results
+    return boxes, scores
 
-def realtime_optimized_inference():
+def realtime_optimized_inference(model_path='pothole_detection_enhanced/v2_accurate/weights/best_ncnn_model/'):
     """
     Example of how to run the most efficient inference for Pi 4
     """
-    # Use the OpenVINO or TFLite version for real-time
-    # model = YOLO('pothole_detection_enhanced/v2_accurate/weights/best_openvino_model/')
-    print("For real-time usage on Raspberry Pi, use the exported OpenVINO or TFLite models.")
-    print("The .pt file is best for training/validation, but OpenVINO is 3-5x faster on RPi.")
+    # NCNN uses NEON-optimized kernels and is the fastest exported format on the Pi's ARM CPU
+    if os.path.isdir(model_path):
+        model = get_model(model_path)
+        print(f"Loaded NCNN model for real-time inference: {model_path}")
+        return model
+
+    print("For real-time usage on Raspberry Pi, use the exported NCNN model (run export.py first).")
+    print("The .pt file is best for training/validation, but NCNN/OpenVINO are 3-5x faster on RPi.")
+    return None
 
 if __name__ == "__main__":
     print("--- Enhanced Inference Engine ---")
@@ -1,11 +1,15 @@
 from ultralytics import YOLO
 import os
+import torch
 
 def train_pothole_model_enhanced():
     # Load a pretrained YOLOv8n model
     # Using 'n' for efficiency, but with advanced training parameters for accuracy
     model = YOLO('yolov8n.pt')
 
+    # Train on the GPU when one is available; CPU training takes days
+    use_gpu = torch.cuda.is_available()
+
     # Enhanced Training with Advanced Augmentation
     # These parameters are specifically tuned for road detection:
     # - mosaic: 1.0 (Stitch 4 images together to help with small objects)
@@ -17,8 +21,10 @@ def train_pothole_model_enhanced():
         epochs=150,           # Increased epochs for better convergence
         imgsz=640,
         patience=30,          # Early stopping to prevent overfitting
-        batch=16,             # Adjust based on GPU memory
-        device='cpu',         # Change to 0 for GPU
+        batch=-1 if use_gpu else 16,  # -1 = auto-size batch to fit GPU memory
+        device=0 if use_gpu else 'cpu',
+        amp=True,             # Mixed precision (FP16) on GPU
+        cache='ram',          # Keep decoded images in RAM so the dataloader keeps up
         
         # Augmentation Strategy
         mosaic=1.0,           # High mosaic for small pothole detection
@@ -1,24 +1,82 @@
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless PNG output; no GUI event loop
 import matplotlib.pyplot as plt
 
+try:
+    import pyarrow.csv as pac
+except ImportError:
+    pac = None
+
+try:
+    from tsdownsample import LTTBDownsampler
+except ImportError:
+    LTTBDownsampler = None
+
+# A 12x6in figure at 100 dpi is 1200 px wide; ~2 points per pixel column is
+# enough for the line to look identical, anything more only overdraws
+MAX_PLOT_POINTS = 2400
+
+
+def read_lidar_csv(path):
+    """
+    Read the LiDAR CSV, using pyarrow's multi-threaded reader when available.
+    """
+    if pac is not None:
+        return pac.read_csv(path).to_pandas()
+    return pd.read_csv(path)
+
+
+def downsample(x, y, n_out=MAX_PLOT_POINTS):
+    """
+    Reduce a series to roughly n_out points while keeping its visual shape.
+    Uses LTTB when tsdownsample is installed, otherwise per-bucket min/max.
+    """
+    if len(x) <= n_out:
+        return x, y
+
+    if LTTBDownsampler is not None:
+        idx = LTTBDownsampler().downsample(x, y, n_out=n_out)
+        return x[idx], y[idx]
+
+    # Fallback: keep the min and max of each bucket so spikes (potholes) survive
+    n_buckets = n_out // 2
+    # Edges span the whole series; bucket widths differ by at most one sample
+    starts = np.linspace(0, len(y), n_buckets + 1, dtype=int)[:-1]
+    bucket = np.repeat(np.arange(n_buckets), np.diff(np.append(starts, len(y))))
+
+    def first_hit(extremes):
+        hits = np.flatnonzero(y == extremes[bucket])
+        _, first = np.unique(bucket[hits], return_index=True)
+        return hits[first]
+
+    idx = np.unique(np.concatenate((first_hit(np.minimum.reduceat(y, starts)),
+                                    first_hit(np.maximum.reduceat(y, starts)))))
+    return x[idx], y[idx]
+
+
 def plot_lidar_data():
     """
     Reads the LiDAR data from the CSV file and generates a plot.
     """
     try:
-        data = pd.read_csv('raspi/lidar_data.csv')
-        
+        data = read_lidar_csv('raspi/lidar_data.csv')
+
         if data.empty:
             print("No data to plot.")
             return
 
+        timestamps, distances = downsample(data['timestamp'].to_numpy(), data['distance'].to_numpy())
+
         plt.figure(figsize=(12, 6))
-        plt.plot(data['timestamp'], data['distance'])
+        line, = plt.plot(timestamps, distances, linewidth=0.5)
+        line.set_rasterized(True)
         plt.xlabel('Timestamp')
         plt.ylabel('Distance (cm)')
         plt.title('LiDAR Road Profile')
         plt.grid(True)
-        plt.savefig('lidar_profile.png')
+        plt.savefig('lidar_profile.png', dpi=100)
         print("Plot saved to lidar_profile.png")
 
     except FileNotFoundError:
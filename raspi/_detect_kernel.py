@@ -0,0 +1,167 @@
+"""
+Numba-compiled per-sample pothole detector for main2.detection_loop.
+
+Every LiDAR frame goes through `process_sample`, which updates the rolling
+median baseline, computes depth and tracks the pothole event. The Python loop
+only does work (logging, camera trigger, analysis) when the returned status is
+EVENT_STARTED or EVENT_CLOSED.
+
+State lives in preallocated arrays (see DetectorState). Without Numba they are
+array.array buffers of the same types, which index to plain Python numbers:
+    window  float32[W]  baseline samples in arrival order (ring)
+    ranked  float32[W]  the same samples kept sorted (median = middle element)
+    events  int16[N]    depths of the current event in whole millimetres
+    counts  int64[6]    [window length, ring head, event sample count,
+                         event sum, sum of squares and max, all in mm]
+    levels  float64[1]  [baseline distance in cm, 0.0 until established]
+"""
+from array import array
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+EVENT_NONE = 0
+EVENT_STARTED = 1
+EVENT_CONTINUE = 2
+EVENT_CLOSED = 3
+
+# Samples needed before the median baseline is trusted
+MIN_BASELINE_SAMPLES = 10
+
+
+def _process_sample(distance, threshold, in_event, window, ranked, events, counts, levels):
+    """
+    Feed one distance (cm) through the detector. Returns (depth, in_event,
+    status). On EVENT_CLOSED the event depths are events[:counts[2]]; the
+    caller resets counts[2:] to 0 after reading them. Event samples past the
+    end of the buffer are dropped. The event's sum, sum of squares and peak
+    are accumulated as samples arrive so no second pass is needed.
+    """
+    # 1. Rolling median baseline, frozen while inside an event
+    if not in_event:
+        size = len(window)
+        n = counts[0]
+        head = counts[1]
+        if n == size:
+            # Evict the oldest sample from both the ring and the sorted copy
+            old = window[head]
+            window[head] = distance
+            counts[1] = (head + 1) % size
+            j = 0
+            while j < n - 1 and ranked[j] != old:
+                j += 1
+            while j < n - 1:
+                ranked[j] = ranked[j + 1]
+                j += 1
+            n -= 1
+        else:
+            window[(head + n) % size] = distance
+        # Insertion step into the sorted copy
+        j = n
+        while j > 0 and ranked[j - 1] > distance:
+            ranked[j] = ranked[j - 1]
+            j -= 1
+        ranked[j] = distance
+        n += 1
+        counts[0] = n
+        if n >= MIN_BASELINE_SAMPLES:
+            levels[0] = ranked[n // 2]
+
+    # 2. Depth below the baseline
+    depth = 0.0
+    if levels[0]:
+        depth = distance - levels[0]
+
+    # 3. Event tracking
+    if depth > threshold:
+        count = counts[2]
+        if count < len(events):
+            mm = round(depth * 10.0)
+            events[count] = mm
+            counts[2] = count + 1
+            counts[3] += mm
+            counts[4] += mm * mm
+            if count == 0 or mm > counts[5]:
+                counts[5] = mm
+        if in_event:
+            return depth, True, EVENT_CONTINUE
+        return depth, True, EVENT_STARTED
+    if in_event:
+        return depth, False, EVENT_CLOSED
+    return depth, False, EVENT_NONE
+
+
+if HAVE_NUMBA:
+    # fastmath is safe here: distances come from integer sensor frames, never NaN/inf
+    process_sample = njit(cache=True, fastmath=True)(_process_sample)
+else:
+    process_sample = _process_sample
+
+
+class DetectorState:
+    """Preallocated arrays threaded through process_sample."""
+
+    def __init__(self, window_size=20, max_event_samples=2048):
+        if HAVE_NUMBA:
+            self.window = np.empty(window_size, dtype=np.float32)
+            self.ranked = np.empty(window_size, dtype=np.float32)
+            self.events = np.empty(max_event_samples, dtype=np.int16)
+            self.counts = np.zeros(6, dtype=np.int64)
+            self.levels = np.zeros(1, dtype=np.float64)
+        else:
+            # Interpreted fallback: NumPy boxes a scalar on every element access,
+            # array.array does not (and stays as compact as the NumPy arrays)
+            self.window = array('f', bytes(4 * window_size))
+            self.ranked = array('f', bytes(4 * window_size))
+            self.events = array('h', bytes(2 * max_event_samples))
+            self.counts = array('q', bytes(8 * 6))
+            self.levels = array('d', bytes(8))
+
+    @property
+    def baseline(self):
+        return float(self.levels[0])
+
+    @property
+    def event_count(self):
+        return int(self.counts[2])
+
+    def event_stats(self):
+        """(peak, mean, std) of the current event in cm, from the running sums."""
+        n, total, squares, peak = (int(v) for v in self.counts[2:])
+        mean = total / n
+        variance = max(squares / n - mean * mean, 0.0)
+        return peak / 10.0, mean / 10.0, variance ** 0.5 / 10.0
+
+    def take_event(self):
+        """Copy out the finished event's depths (int16 mm) and clear the buffer."""
+        readings = np.frombuffer(self.events, dtype=np.int16, count=self.counts[2]).copy()
+        self._clear_event()
+        return readings
+
+    def discard_event(self):
+        """Clear the event buffer without copying (short glitches)."""
+        self._clear_event()
+
+    def _clear_event(self):
+        counts = self.counts
+        counts[2] = counts[3] = counts[4] = counts[5] = 0
+
+    def reset_baseline(self, distance):
+        """Restart the baseline at `distance` and drop any partial event."""
+        self.window[0] = distance
+        self.ranked[0] = distance
+        self.counts[0] = 1
+        self.counts[1] = 0
+        self._clear_event()
+        self.levels[0] = distance
+
+    def warm_up(self):
+        """Trigger JIT compilation (or load it from cache) before the first frame."""
+        scratch = DetectorState(len(self.window), 1)
+        process_sample(0.0, 1.0, False, scratch.window, scratch.ranked,
+                       scratch.events, scratch.counts, scratch.levels)
@@ -0,0 +1,96 @@
+"""
+TF02-Pro frame decoders shared by the LiDAR recorder and sensors.LiDAR,
+with a Numba-compiled kernel for the hot loop.
+
+Frame layout: 0x59 0x59 | dist L H | strength L H | temp L H | checksum
+"""
+import struct
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+FRAME_HEADER = b'\x59\x59'
+FRAME_LEN = 9
+_FRAME_FIELDS = struct.Struct('<HH')  # distance, strength (little-endian)
+
+
+def extract_frames(buf):
+    """
+    Pull every checksum-valid frame out of `buf` (a bytearray) as
+    (distance, strength) tuples. Consumed bytes are removed in place and any
+    partial trailing frame is kept for the next read, so a lost byte only
+    costs one frame instead of desyncing the stream.
+    """
+    frames = []
+    i = buf.find(FRAME_HEADER)
+    while i != -1 and i + FRAME_LEN <= len(buf):
+        if sum(buf[i:i + 8]) & 0xFF == buf[i + 8]:
+            frames.append(_FRAME_FIELDS.unpack_from(buf, i + 2))
+            i = buf.find(FRAME_HEADER, i + FRAME_LEN)
+        else:
+            # False header (e.g. 0x59 inside the payload); hunt for the next one
+            i = buf.find(FRAME_HEADER, i + 1)
+
+    if i == -1:
+        # Keep a trailing 0x59: it may be the first half of a header
+        keep = 1 if buf[-1:] == b'\x59' else 0
+        del buf[:len(buf) - keep]
+    else:
+        del buf[:i]
+    return frames
+
+
+def _parse_frames(buf):
+    """
+    Scan a uint8 buffer for checksum-valid frames.
+
+    Returns (distances, strengths, consumed) where `consumed` is the number of
+    leading bytes that were decoded or rejected; the rest is an incomplete tail.
+    """
+    n = buf.shape[0]
+    max_frames = n // FRAME_LEN
+    distances = np.empty(max_frames, dtype=np.int64)
+    strengths = np.empty(max_frames, dtype=np.int64)
+    count = 0
+    i = 0
+    while i + FRAME_LEN <= n:
+        if buf[i] == 0x59 and buf[i + 1] == 0x59:
+            checksum = np.int64(0)
+            for k in range(8):
+                checksum += np.int64(buf[i + k])
+            if (checksum & 0xFF) == buf[i + 8]:
+                distances[count] = np.int64(buf[i + 2]) + np.int64(buf[i + 3]) * 256
+                strengths[count] = np.int64(buf[i + 4]) + np.int64(buf[i + 5]) * 256
+                count += 1
+                i += FRAME_LEN
+                continue
+        i += 1
+    return distances[:count], strengths[:count], i
+
+
+if HAVE_NUMBA:
+    parse_frames = njit(cache=True, nogil=True)(_parse_frames)
+else:
+    parse_frames = None
+
+
+def extract_frames_jit(buf):
+    """
+    Drop-in replacement for lidar_recorder.extract_frames backed by the
+    compiled kernel. Consumed bytes are removed from `buf` (a bytearray).
+    """
+    view = np.frombuffer(buf, dtype=np.uint8)
+    distances, strengths, consumed = parse_frames(view)
+    # The view pins the bytearray's memory; release it before resizing
+    del view
+    del buf[:consumed]
+    return list(zip(distances.tolist(), strengths.tolist()))
+
+
+# Use the compiled decoder when Numba is available on the Pi
+decode_frames = extract_frames_jit if HAVE_NUMBA else extract_frames
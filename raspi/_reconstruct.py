@@ -0,0 +1,50 @@
+"""
+Numba-compiled spatial reconstruction for the LiDAR surround analyzer.
+
+Turns a batch of (timestamp, distance, strength) readings into road-profile
+points: X = longitudinal distance travelled (cm), Y = measured distance (cm),
+Z = lateral offset (0 for a fixed single-point LiDAR), plus signal strength.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _reconstruct(ts, dist, strength, speed):
+    """
+    Returns an (N, 4) float64 array of [x, y, z, strength] rows; x is measured
+    from the first (oldest) reading in the batch.
+    """
+    n = ts.shape[0]
+    out = np.empty((n, 4), dtype=np.float64)
+    if n == 0:
+        return out
+    t0 = ts[0]
+    scale = speed * 100.0  # m/s -> cm/s
+    for i in range(n):
+        out[i, 0] = (ts[i] - t0) * scale
+        out[i, 1] = dist[i]
+        out[i, 2] = 0.0
+        out[i, 3] = strength[i]
+    return out
+
+
+def _reconstruct_numpy(ts, dist, strength, speed):
+    """Vectorized NumPy fallback with the same output as the compiled kernel."""
+    out = np.empty((ts.shape[0], 4), dtype=np.float64)
+    if ts.shape[0]:
+        out[:, 0] = (ts - ts[0]) * (speed * 100.0)
+    out[:, 1] = dist
+    out[:, 2] = 0.0
+    out[:, 3] = strength
+    return out
+
+
+if HAVE_NUMBA:
+    reconstruct = njit(cache=True, fastmath=True)(_reconstruct)
+else:
+    reconstruct = _reconstruct_numpy
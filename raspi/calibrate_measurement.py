@@ -19,6 +19,8 @@ import argparse
 from typing import List, Tuple
 import json
 
+import numpy as np
+
 # Add raspi to path
 sys.path.insert(0, '/home/admin/main/IOT/raspi')
 
@@ -64,39 +66,44 @@ class MeasurementCalibrator:
         print(f"Collecting {samples} samples over {duration:.1f} seconds...")
         print("Press Ctrl+C to stop early\n")
         
-        readings = []
-        start_time = time.time()
+        # Preallocated sample buffer; n is the number of valid samples
+        readings = np.empty(samples, dtype=np.float64)
+        n = 0
+        # Integer monotonic clock: no float math per iteration, immune to clock jumps
+        deadline_ns = time.monotonic_ns() + int(duration * 1e9)
         
         try:
-            while len(readings) < samples and (time.time() - start_time) < duration:
+            while n < samples and time.monotonic_ns() < deadline_ns:
                 dist = self.lidar.get_distance()
                 if dist is not None and dist > 0:
                     dist_cm = dist * 100  # Convert to cm
-                    readings.append(dist_cm)
+                    readings[n] = dist_cm
+                    n += 1
                     
-                    if len(readings) % 10 == 0:
-                        print(f"  Sample {len(readings)}: {dist_cm:.2f} cm")
+                    if n % 10 == 0:
+                        print(f"  Sample {n}: {dist_cm:.2f} cm")
                 
-                time.sleep(0.05)  # 20Hz
+                else:
+                    self.lidar.wait_for_frame()
         
         except KeyboardInterrupt:
             print("\nMeasurement stopped by user")
         
-        if len(readings) < 10:
+        if n < 10:
             print("✗ Insufficient samples collected")
             return None
         
-        # Calculate statistics
-        import numpy as np
-        mean = np.mean(readings)
-        std = np.std(readings)
-        minimum = np.min(readings)
-        maximum = np.max(readings)
+        # Calculate statistics on the filled part of the buffer
+        readings = readings[:n]
+        mean = readings.mean()
+        std = readings.std()
+        minimum = readings.min()
+        maximum = readings.max()
         
         print(f"\n{'='*60}")
         print("BASELINE RESULTS")
         print(f"{'='*60}")
-        print(f"Samples collected: {len(readings)}")
+        print(f"Samples collected: {n}")
         print(f"Mean distance:     {mean:.2f} cm")
         print(f"Std deviation:     {std:.2f} cm")
         print(f"Min distance:      {minimum:.2f} cm")
@@ -109,7 +116,7 @@ class MeasurementCalibrator:
             'baseline_std': std,
             'baseline_min': minimum,
             'baseline_max': maximum,
-            'sample_count': len(readings),
+            'sample_count': n,
             'timestamp': time.time()
         }
         
@@ -143,30 +150,37 @@ class MeasurementCalibrator:
         print("\nMove sensor over pothole at constant speed...")
         print("Press Ctrl+C when done\n")
         
-        readings = []
-        start_time = time.time()
+        # Growable sample buffer (doubles when full); n is the number of valid samples
+        readings = np.empty(1024, dtype=np.float64)
+        n = 0
+        start_ns = time.monotonic_ns()
         
         try:
             while True:
                 dist = self.lidar.get_distance()
                 if dist is not None and dist > 0:
                     dist_cm = dist * 100
-                    readings.append(dist_cm)
+                    if n == readings.size:
+                        readings = np.resize(readings, readings.size * 2)
+                    readings[n] = dist_cm
+                    n += 1
                     
-                    if len(readings) % 10 == 0:
-                        print(f"  Sample {len(readings)}: {dist_cm:.2f} cm")
-                
-                time.sleep(0.05)
+                    if n % 10 == 0:
+                        print(f"  Sample {n}: {dist_cm:.2f} cm")
+                else:
+                    self.lidar.wait_for_frame()
         
         except KeyboardInterrupt:
             print("\nMeasurement complete")
         
-        duration = time.time() - start_time
+        duration = (time.monotonic_ns() - start_ns) / 1e9
         
-        if len(readings) < 5:
+        if n < 5:
             print("✗ Insufficient samples for analysis")
             return
         
+        readings = readings[:n]
+        
         # Analyze pothole
         result = measure_pothole(readings, duration, vehicle_speed)
         
@@ -219,29 +233,40 @@ class MeasurementCalibrator:
         print(f"Running for {duration:.0f} seconds...")
         print("Move sensor over various surfaces\n")
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        deadline_ns = start_ns + int(duration * 1e9)
         sample_count = 0
+        next_print_ns = 0
         
         try:
-            while (time.time() - start_time) < duration:
+            while True:
+                # One clock read per iteration, shared by the deadline and print throttle
+                now_ns = time.monotonic_ns()
+                if now_ns >= deadline_ns:
+                    break
                 dist = self.lidar.get_distance()
                 if dist is not None and dist > 0:
                     dist_cm = dist * 100
                     sample_count += 1
                     
-                    # Simple visualization
-                    bar_length = int(dist_cm / 2)
-                    bar = '█' * min(bar_length, 50)
-                    
-                    print(f"\r{dist_cm:6.2f} cm  {bar:<50}", end='', flush=True)
-                
-                time.sleep(0.05)
+                    # Redraw at most 20 times a second so the terminal isn't the bottleneck
+                    if now_ns >= next_print_ns:
+                        next_print_ns = now_ns + 50_000_000
+                        
+                        # Simple visualization
+                        bar_length = int(dist_cm / 2)
+                        bar = '█' * min(bar_length, 50)
+                        
+                        print(f"\r{dist_cm:6.2f} cm  {bar:<50}", end='', flush=True)
+                else:
+                    self.lidar.wait_for_frame()
         
         except KeyboardInterrupt:
             print("\n\nDemo stopped by user")
         
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
         print(f"\n\nTotal samples: {sample_count}")
-        print(f"Average rate:  {sample_count/duration:.1f} Hz")
+        print(f"Average rate:  {sample_count/elapsed:.1f} Hz")
 
 
 def main():
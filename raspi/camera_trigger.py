@@ -101,21 +101,20 @@ class ESP32Trigger:
         if not self.ser:
             return False
 
+        # Accumulate raw bytes so a marker split across two reads is still found
+        acc = bytearray()
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
-                if self.ser.in_waiting > 0:
-                    response = self.ser.read(
-                        self.ser.in_waiting
-                    ).decode(errors='ignore')
-                    if "UPLOAD_SUCCESS" in response:
-                        print("ESP32-CAM upload confirmation received.")
-                        return True
-                    if "UPLOAD_FAILED" in response:
-                        print("ESP32-CAM upload failed.")
-                        return False
+                # Blocks for up to the port timeout, so no sleep is needed
+                acc += self.ser.read(self.ser.in_waiting or 1)
             except (serial.SerialException, OSError):
                 return False
-            time.sleep(0.1)
+            if acc.find(b"UPLOAD_SUCCESS") >= 0:
+                print("ESP32-CAM upload confirmation received.")
+                return True
+            if acc.find(b"UPLOAD_FAILED") >= 0:
+                print("ESP32-CAM upload failed.")
+                return False
         print("ESP32-CAM confirmation timeout.")
         return False
@@ -1,11 +1,29 @@
 """
 This module defines the communication classes for the Pothole Detection System.
 """
+import re
+import select
 import time
 import json
 import serial
 from soft_serial import SoftwareSerial
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Unsolicited result of AT+HTTPACTION: "+HTTPACTION: <method>,<status>,<length>"
+HTTPACTION_RE = re.compile(rb"\+HTTPACTION:\s*\d+,(\d+),\d+\r?\n")
+
+
+def encode_json(data):
+    """Encodes data as UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # Measurements may carry numpy scalars from the analyzer
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode()
+
 
 class GSM:
     """
@@ -56,60 +74,154 @@ class GSM:
         self.send_at('AT+SAPBR=3,1,"APN","internet"')
         self.send_at("AT+SAPBR=1,1")
 
-    def send_at(self, cmd, wait=1):
+    def _read_until(self, markers, timeout):
+        """
+        Reads from the hardware UART until any marker appears or the timeout
+        elapses. Wakes via select() as soon as bytes arrive, so a modem reply in
+        50 ms returns in 50 ms instead of after a fixed sleep.
+
+        Args:
+            markers (tuple): Byte strings (or compiled byte regexes) that end the response.
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bytes: Everything received.
+        """
+        try:
+            fd = self.ser.fileno()
+        except (AttributeError, OSError, ValueError):
+            # No selectable file descriptor (e.g. Windows); wait the full time
+            time.sleep(timeout)
+            return self.ser.read(self.ser.in_waiting) if self.ser.in_waiting else b""
+
+        buf = bytearray()
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break
+            buf += self.ser.read(self.ser.in_waiting or 1)
+            if any(marker.search(buf) if hasattr(marker, 'search') else marker in buf
+                   for marker in markers):
+                break
+        return bytes(buf)
+
+    def _command(self, cmd, wait=1, expect=(b"OK\r\n", b"ERROR"), soft_wait=None):
+        """
+        Sends an AT command and returns the raw reply. Serial errors propagate.
+
+        SoftwareSerial cannot be read back reliably, so on that port the
+        command is written, the wait elapses and the reply is empty. There
+        `wait` is a fixed sleep, not an upper bound, so callers that pass a long
+        timeout give a shorter soft_wait for that port.
+        """
+        if isinstance(self.ser, serial.Serial):
+            self.ser.write((cmd + "\r\n").encode())
+            return self._read_until(expect, wait)
+        self.ser.write(cmd + "\r\n")
+        time.sleep(wait if soft_wait is None else soft_wait)
+        return b""
+
+    def send_at(self, cmd, wait=1, expect=(b"OK\r\n", b"ERROR")):
         """
         Sends an AT command to the GSM module.
 
         Args:
             cmd (str): The AT command to send.
-            wait (int, optional): The time to wait for a response. Defaults to 1.
+            wait (int, optional): The maximum time to wait for a response. Defaults to 1.
+            expect (tuple, optional): Responses that complete the command.
+                Defaults to OK / ERROR.
 
         Returns:
-            str: The response from the GSM module.
+            str: The response from the GSM module ("" on a serial error).
         """
         if not self.ser:
             return ""
         try:
-            if isinstance(self.ser, serial.Serial):
-                self.ser.write((cmd + "\r\n").encode())
-                time.sleep(wait)
-                if self.ser.in_waiting:
-                    return self.ser.read(self.ser.in_waiting).decode(errors='ignore')
-            else:
-                self.ser.write(cmd + "\r\n")
-                time.sleep(wait)
-                return ""
+            return self._command(cmd, wait, expect).decode(errors='ignore')
         except (serial.SerialException, OSError):
             return ""
-        return ""
 
     def send_data(self, data):
         """
         Sends data to the backend server.
 
         Args:
-            data (dict): The data to send.
+            data (dict | bytes): The data to send, or an already encoded JSON body.
+
+        Returns:
+            bool: True if the record was accepted.
         """
-        if not self.ser:
-            return
-        json_data = json.dumps(data)
+        return not self.send_batch([data])
+
+    def _post(self, json_body):
+        """
+        POSTs one body inside an open HTTP session.
+
+        Returns:
+            int | None: The HTTP status from +HTTPACTION, None if the modem
+            refused the body or gave no status. On SoftwareSerial no reply can
+            be read, so a completed write is reported as 200.
+        """
+        hw = isinstance(self.ser, serial.Serial)
+
+        # The SIM800L answers DOWNLOAD when it is ready to receive the body
+        reply = self._command(f"AT+HTTPDATA={len(json_body)},10000", wait=0.5, expect=(b"DOWNLOAD", b"ERROR"))
+        if hw and b"DOWNLOAD" not in reply:
+            return None
+        self.ser.write(json_body)
+        if hw:
+            self._read_until((b"OK\r\n", b"ERROR"), 1)
+        else:
+            time.sleep(1)
+
+        # HTTPACTION replies OK immediately; the request is done at +HTTPACTION:.
+        # 15 s is only an upper bound where select() sees the reply arrive
+        reply = self._command("AT+HTTPACTION=1", wait=15, expect=(HTTPACTION_RE, b"ERROR"), soft_wait=3)
+        if not hw:
+            return 200
+        match = HTTPACTION_RE.search(reply)
+        return int(match.group(1)) if match else None
+
+    def send_batch(self, items):
+        """
+        Sends several records to the backend in one HTTP session: the
+        HTTPINIT/HTTPPARA setup and HTTPTERM are paid once per batch instead of
+        once per record.
+
+        Args:
+            items (list): The data dicts (or encoded JSON bodies) to send, one POST each.
+
+        Returns:
+            list: The items the backend did not acknowledge with a 2xx status,
+            in their original order.
+
+        Raises:
+            serial.SerialException, OSError: If the UART fails mid-batch; the
+            caller cannot tell which records got through.
+        """
+        if not self.ser or not items:
+            return list(items)
         self.send_at("AT+HTTPINIT")
         self.send_at("AT+HTTPPARA=\"CID\",1")
         self.send_at(f"AT+HTTPPARA=\"URL\",\"{self.server_url}/api/potholes\"")
         self.send_at("AT+HTTPPARA=\"CONTENT\",\"application/json\"")
 
-        self.send_at(f"AT+HTTPDATA={len(json_data)},10000", wait=0.5)
+        failed = []
         try:
-            if isinstance(self.ser, serial.Serial):
-                self.ser.write(json_data.encode())
-            else:
-                self.ser.write(json_data)
-
-            time.sleep(1)
-            self.send_at("AT+HTTPACTION=1", wait=3)
+            for data in items:
+                # Bytes straight from the encoder: no separate .encode() before the UART write.
+                # Callers that also upload over HTTP pass the body pre-encoded.
+                json_body = data if isinstance(data, bytes) else encode_json(data)
+                status = self._post(json_body)
+                if status is None or not 200 <= status < 300:
+                    failed.append(data)
+        finally:
             self.send_at("AT+HTTPTERM")
-        except (serial.SerialException, OSError):
-            pass
+        return failed
 
     def close(self):
         """Closes the serial connection."""
@@ -1,6 +1,8 @@
 import serial
 import time
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Comprehensive GPS Diagnostic
 # 1. Scans all standard UART ports
@@ -8,37 +10,47 @@ import sys
 # 3. Output raw NMEA data for verification
 
 def test_port(port, baud):
+    """Returns (port, baud) if NMEA data is seen, otherwise None."""
+    # One print per outcome so lines from parallel probes don't interleave
+    tag = f"{port} @ {baud}"
     try:
         ser = serial.Serial(port, baud, timeout=2)
-        print(f"Checking {port} at {baud} baud...", end="", flush=True)
+        print(f"Checking {tag}...", flush=True)
         time.sleep(1.5) # Wait for data
-        print(".", end="", flush=True)
         
         if ser.in_waiting > 0:
             # Read a chunk
             raw = ser.read(ser.in_waiting)
-            try:
-                decoded = raw.decode('ascii', errors='replace')
-                # Check for standard NMEA headers
-                if "$GP" in decoded or "$GN" in decoded:
-                    print(f"\n[SUCCESS] NMEA data detected on {port} @ {baud}!")
-                    print(f"Sample: {decoded[:100].strip()}...")
-                    ser.close()
-                    return True
-                else:
-                    print(f"\n[WARNING] Data received but not NMEA (Noise/Wrong Baud).")
-                    print(f"Sample: {raw[:20]}")
-            except:
-                print(f"\n[WARNING] Binary/Garbage data received.")
+            # Check for standard NMEA headers on the raw bytes; only decode a hit
+            start = raw.find(b"$GP")
+            if start < 0:
+                start = raw.find(b"$GN")
+            if start >= 0:
+                sample = raw[start:start + 100].decode('ascii', errors='replace')
+                print(f"[SUCCESS] NMEA data detected on {tag}!\nSample: {sample.strip()}...")
+                ser.close()
+                return (port, baud)
+            else:
+                print(f"[WARNING] {tag}: Data received but not NMEA (Noise/Wrong Baud/Binary). Sample: {raw[:20]}")
         else:
-            print(" No Data.")
+            print(f"{tag}: No Data.")
         
         ser.close()
     except OSError:
-        print(" Port busy or unavailable.")
+        print(f"{tag}: Port busy or unavailable.")
     except Exception as e:
-        print(f" Error: {e}")
-    return False
+        print(f"{tag}: Error: {e}")
+    return None
+
+def probe_port(port, bauds, stop):
+    """Tries each baud rate on one port in turn; stops early once any port has a hit."""
+    for baud in bauds:
+        if stop.is_set():
+            return None
+        hit = test_port(port, baud)
+        if hit:
+            return hit
+    return None
 
 def main():
     print("=== ULTRA GPS DIAGNOSTIC TOOL ===")
@@ -57,13 +69,19 @@ def main():
     
     found = False
     
-    for port in ports:
-        for baud in bauds:
-            if test_port(port, baud):
+    # Probe ports in parallel (the work is waiting on serial I/O). Baud rates on
+    # the same port stay sequential: two opens of one tty would fight over its speed.
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=len(ports)) as ex:
+        futures = [ex.submit(probe_port, port, bauds, stop) for port in ports]
+        for future in as_completed(futures):
+            hit = future.result()
+            if hit:
                 found = True
+                stop.set()
+                port, baud = hit
                 print(f"\n>> RECOMMENDATION: Configure sensors.py to use PORT={port}, BAUD={baud}")
                 break
-        if found: break
     
     if not found:
         print("\n[FAILURE] No GPS found.")
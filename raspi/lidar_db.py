@@ -0,0 +1,32 @@
+"""
+Column-oriented reads of the raw LiDAR table (lidar_readings.db).
+
+Shared by the recorder and the surround analyzer; kept free of serial/GPIO
+imports so the analyzer can run on a machine without the sensor stack.
+"""
+import numpy as np
+
+
+def fetch_since(conn, last_id, limit=500):
+    """
+    Fetch readings with id > last_id as parallel column arrays (structure of
+    arrays) instead of per-row tuples/dicts:
+    (ids int64, timestamps float64, distances float32, strengths uint16, session_id).
+    Timestamps come back in seconds and distances in cm; the table stores
+    integer ms and mm. Returns None when there are no new rows.
+    """
+    rows = conn.execute(
+        "SELECT id, ts_ms, dist_mm, strength, session_id FROM raw_data "
+        "WHERE id > ? ORDER BY id ASC LIMIT ?",
+        (last_id, limit)
+    ).fetchall()
+    if not rows:
+        return None
+    ids, ts, dist, strength, sessions = zip(*rows)
+    return (
+        np.array(ids, dtype=np.int64),
+        np.array(ts, dtype=np.int64) * 1e-3,
+        np.array(dist, dtype=np.int32).astype(np.float32) * np.float32(0.1),
+        np.array(strength, dtype=np.uint16),
+        sessions[-1],
+    )
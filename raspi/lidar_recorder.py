@@ -1,9 +1,12 @@
+import queue
 import sqlite3
 import time
 import serial
 import threading
 from datetime import datetime
 
+from _lidar_parse import decode_frames
+
 # =================================================================
 # High-Speed LiDAR Data Recorder
 # This script reads raw TF02-Pro data and saves it to a dedicated DB
@@ -14,64 +17,141 @@ class LidarDatabase:
     def __init__(self, db_path="lidar_readings.db"):
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.cursor = self.conn.cursor()
+        # WAL + NORMAL sync: commits no longer fsync the main DB file
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self.init_db()
 
     def init_db(self):
+        # Integer columns: ms timestamps and mm distances are exact for the
+        # TF02-Pro and take 2-6 bytes each instead of an 8-byte REAL
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS raw_data (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp REAL,
-                distance_cm REAL,
+                ts_ms INTEGER,
+                dist_mm INTEGER,
                 strength INTEGER,
                 session_id TEXT
             )
         """)
+        columns = {row[1] for row in self.cursor.execute("PRAGMA table_info(raw_data)")}
+        if "distance_cm" in columns:
+            self._migrate_legacy_schema()
         self.conn.commit()
 
-    def save_reading(self, distance, strength, session_id):
-        self.cursor.execute(
-            "INSERT INTO raw_data (timestamp, distance_cm, strength, session_id) VALUES (?, ?, ?, ?)",
-            (time.time(), distance, strength, session_id)
+    def _migrate_legacy_schema(self):
+        """Rewrite a pre-quantization raw_data table (REAL timestamp/distance_cm) in place."""
+        print("Migrating raw_data to integer ts_ms/dist_mm columns...")
+        self.cursor.execute("ALTER TABLE raw_data RENAME TO raw_data_legacy")
+        self.cursor.execute("""
+            CREATE TABLE raw_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts_ms INTEGER,
+                dist_mm INTEGER,
+                strength INTEGER,
+                session_id TEXT
+            )
+        """)
+        # Keep the ids so an analyzer's last_id stays valid across the migration
+        self.cursor.execute("""
+            INSERT INTO raw_data (id, ts_ms, dist_mm, strength, session_id)
+            SELECT id, CAST(ROUND(timestamp * 1000) AS INTEGER),
+                   CAST(ROUND(distance_cm * 10) AS INTEGER), strength, session_id
+            FROM raw_data_legacy
+        """)
+        self.cursor.execute("DROP TABLE raw_data_legacy")
+
+    def save_batch(self, rows):
+        """Insert (ts_ms, dist_mm, strength, session_id) rows in one transaction."""
+        self.cursor.executemany(
+            "INSERT INTO raw_data (ts_ms, dist_mm, strength, session_id) VALUES (?, ?, ?, ?)",
+            rows
         )
         self.conn.commit()
 
 class LidarRecorder:
+    FLUSH_SIZE = 200
+    FLUSH_INTERVAL = 0.5  # seconds
+
     def __init__(self, port="/dev/ttyAMA5", baud=115200):
         self.port = port
         self.baud = baud
         self.db = LidarDatabase()
         self.running = False
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # UART reader -> queue -> SQLite writer, so disk stalls never block serial reads
+        self.queue = queue.Queue(maxsize=4096)
+        self.dropped = 0
+        self._threads = []
+        self._buf = bytearray()
+        self._ctr = 0
 
     def start(self):
         self.running = True
+        self._threads = [
+            threading.Thread(target=self._reader, name="lidar-reader", daemon=True),
+            threading.Thread(target=self._writer, name="lidar-writer", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        for t in self._threads:
+            t.join()
+
+    def _reader(self):
         try:
             ser = serial.Serial(self.port, self.baud, timeout=1)
             print(f"LiDAR Recorder Started on {self.port} (Session: {self.session_id})")
             
             while self.running:
-                if ser.in_waiting >= 9:
-                    res = ser.read(9)
-                    if res[0] == 0x59 and res[1] == 0x59: # Header
-                        distance = res[2] + res[3] * 256
-                        strength = res[4] + res[5] * 256
-                        
-                        # Save to Database
-                        self.db.save_reading(distance, strength, self.session_id)
-                        
-                        # Optional: Print every 20th reading to console (prevent flooding)
-                        if int(time.time() * 100) % 20 == 0:
-                            print(f"Captured: {distance} cm | Strength: {strength}")
-                
-                time.sleep(0.01) # 100Hz capture freq
+                # Blocks until at least one byte arrives (or the 1s timeout)
+                self._buf.extend(ser.read(max(ser.in_waiting, 1)))
+                now_ms = int(time.time() * 1000)
+
+                for distance, strength in decode_frames(self._buf):
+                    # Hand off to the writer thread; drop if it has fallen far behind
+                    try:
+                        self.queue.put_nowait((now_ms, distance * 10, strength, self.session_id))
+                    except queue.Full:
+                        self.dropped += 1
         except Exception as e:
             print(f"LiDAR Recorder Error: {e}")
         finally:
             self.running = False
             if 'ser' in locals(): ser.close()
 
+    def _writer(self):
+        batch = []
+        last_flush = time.time()
+        # Keep draining after the reader stops so no queued readings are lost
+        while self.running or not self.queue.empty():
+            try:
+                reading = self.queue.get(timeout=0.1)
+                batch.append(reading)
+
+                # Print every 20th reading to console (prevent flooding); done here
+                # so terminal I/O never stalls the UART reader
+                self._ctr += 1
+                if self._ctr >= 20:
+                    self._ctr = 0
+                    print(f"Captured: {reading[1] / 10:g} cm | Strength: {reading[2]}")
+            except queue.Empty:
+                pass
+
+            if batch and (len(batch) >= self.FLUSH_SIZE or time.time() - last_flush > self.FLUSH_INTERVAL):
+                self.db.save_batch(batch)
+                batch.clear()
+                last_flush = time.time()
+
+        if batch:
+            self.db.save_batch(batch)
+        if self.dropped:
+            print(f"LiDAR Recorder: dropped {self.dropped} readings (writer queue full)")
+
     def stop(self):
         self.running = False
+        for t in self._threads:
+            if t is not threading.current_thread():
+                t.join()
 
 if __name__ == "__main__":
     recorder = LidarRecorder()
@@ -1,8 +1,25 @@
 import sqlite3
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import math
+import numpy as np
+
+from _reconstruct import reconstruct
+from lidar_db import fetch_since
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(payload):
+    """Serialize to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
 
 # =================================================================
 # LiDAR Spatial Analyzer (Surroundings & Road Profile)
@@ -14,65 +31,87 @@ BACKEND_URL = "http://localhost:8000/api/road-profile"
 DB_PATH = "d:/Rohit_imp_file/Project/IOT/IOT/raspi/lidar_readings.db"
 
 class LidarSpatialAnalyzer:
+    BATCH_LIMIT = 500  # Cap on rows pulled per cycle
+
     def __init__(self, speed_mps=0.3):
         self.speed = speed_mps  # Estimated robot speed in meters per second
         self.last_sync_time = time.time()
-        self.processed_ids = []
+        self.last_id = None  # Highest raw_data.id already synced
+        self.conn = None
+        # Keep-alive session: reuse one TCP connection to the backend every cycle
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
+
+    def _connect(self):
+        """Open the read-only database connection once and reuse it every cycle."""
+        if self.conn is None:
+            self.conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+            self.conn.execute("PRAGMA query_only=1")
+            # Serve reads from the page cache via mmap and keep ~8 MB of pages hot
+            self.conn.execute("PRAGMA mmap_size=67108864")
+            self.conn.execute("PRAGMA cache_size=-8000")
+        return self.conn
 
     def get_new_readings(self):
-        """Fetch un-processed readings from the local database."""
+        """
+        Fetch un-processed readings from the local database as column arrays
+        (ids, timestamps, distances, strengths, session_id), or None.
+        """
         try:
-            conn = sqlite3.connect(DB_PATH)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Fetch last 50 readings for a mini-batch update
-            cursor.execute("SELECT * FROM raw_data ORDER BY id DESC LIMIT 50")
-            rows = cursor.fetchall()
-            conn.close()
-            return rows
+            conn = self._connect()
+
+            if self.last_id is None:
+                # First cycle: start from the most recent mini-batch, not the whole history
+                (max_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM raw_data").fetchone()
+                self.last_id = max(0, max_id - 50)
+
+            # Only rows newer than the last synced id (primary-key seek, oldest first)
+            batch = fetch_since(conn, self.last_id, self.BATCH_LIMIT)
+            if batch is not None:
+                self.last_id = int(batch[0][-1])
+            return batch
         except Exception as e:
             print(f"DB Error: {e}")
-            return []
+            return None
 
     def process_and_sync(self):
         print("LiDAR Analyzer: Starting real-time spatial reconstruction...")
         
         while True:
-            rows = self.get_new_readings()
-            if not rows:
+            batch = self.get_new_readings()
+            if batch is None:
                 time.sleep(1)
                 continue
 
-            points = []
-            start_ts = rows[-1]['timestamp']
-            
-            for row in rows:
-                # Delta time from the start of this batch
-                dt = row['timestamp'] - start_ts
-                
-                # Spatial Reconstruction Logic:
-                # X = Longitudinal distance (based on vehicle speed)
-                # Y = Vertical Depth (measured distance)
-                # Z = Lateral (since it's a fixed point LiDAR, we assume center)
-                
-                x = dt * self.speed * 100 # Convert to cm
-                y = row['distance_cm']
-                points.append({
-                    "x": round(x, 2),
-                    "y": round(y, 2),
-                    "z": 0,
-                    "strength": row['strength']
-                })
+            _, ts, dist, strength, session_id = batch
+
+            # Spatial Reconstruction Logic (compiled kernel, see _reconstruct.py):
+            # X = Longitudinal distance (based on vehicle speed), from the start of this batch
+            # Y = Vertical Depth (measured distance)
+            # Z = Lateral (since it's a fixed point LiDAR, we assume center)
+            out = reconstruct(ts, dist, strength, self.speed)
+            x = np.round(out[:, 0], 2)
+            y = np.round(out[:, 1], 2)
+
+            # The backend stores a list of {x, y, z} points, so build dicts only here
+            points = [
+                {"x": px, "y": py, "z": 0, "strength": st}
+                for px, py, st in zip(x.tolist(), y.tolist(), strength.tolist())
+            ]
 
             # Sync with Backend
             payload = {
-                "session_id": rows[0]['session_id'],
+                "session_id": session_id,
                 "points": points
             }
             
             try:
-                res = requests.post(BACKEND_URL, json=payload, timeout=2)
+                res = self.session.post(
+                    BACKEND_URL,
+                    data=_dumps(payload),
+                    headers={"Content-Type": "application/json"},
+                    timeout=2
+                )
                 if res.status_code == 200:
                     print(f"Synced {len(points)} road profile points to Dashboard.")
             except Exception as e:
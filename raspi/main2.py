@@ -14,9 +14,11 @@ Optimized version with:
 - Configuration management
 - Resource cleanup
 """
+from bisect import bisect_right
 import sys
 import time
 import threading
+import queue
 import logging
 import sqlite3
 import requests
@@ -26,8 +28,9 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from pathlib import Path
 import json
-from datetime import datetime
+from collections import OrderedDict
 
+import numpy as np
 import serial
 try:
     from RPi import GPIO
@@ -37,6 +40,11 @@ except ImportError:
     from unittest.mock import MagicMock
     GPIO = MagicMock()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Add project root to Python path
 import os
@@ -45,12 +53,17 @@ project_root = os.path.dirname(current_dir)
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from sensors import LiDAR, Ultrasonic, GPS
-from communication import GSM
+from sensors import LiDAR, Ultrasonic, GPS, SharedGPS
+from communication import GSM, encode_json
 from camera_trigger import ESP32Trigger
 from motors import MotorController
 from soft_serial import SoftwareSerial
 from sensor_ml_model.pi_inference import SensorMLInference
+from _detect_kernel import DetectorState, process_sample, EVENT_STARTED, EVENT_CLOSED
+try:
+    from pothole_measurement import PotholeAnalyzer
+except ImportError:
+    PotholeAnalyzer = None
 
 
 # --- Configuration ---
@@ -100,14 +113,24 @@ class SystemConfig:
     model_path: str = os.path.join(project_root, 'sensor_ml_model', 'pothole_sensor_model.pkl')
     require_ml_model: bool = True
     require_gps_fix: bool = True
+    gps_start_timeout: float = 30.0  # seconds for the spawned GPS process to report in
     enable_raw_lidar_logging: bool = True
-    raw_lidar_db: str = "lidar_readings.db"
+    raw_lidar_log: str = "lidar_raw.bin"  # one memmap ring per day: lidar_raw_YYYYMMDD.bin
+    raw_lidar_max_rows: int = 1_000_000  # fixed-size ring; oldest rows are overwritten
+    raw_lidar_keep_days: int = 7  # daily ring files older than this are deleted
+    raw_lidar_event_decimation: int = 5  # log every Nth raw point while a pothole event is open
     
     # Bluetooth Fallback Ports
     bluetooth_fallback_ports: list = None
     
     def __post_init__(self):
         """Initialize derived attributes."""
+        # Severity is a bisect over the band upper bounds, which must be ascending
+        if not self.severity_minor[1] <= self.severity_moderate[1] <= self.severity_critical[1]:
+            raise ValueError(
+                f"Severity bands must be ascending: {self.severity_minor}, "
+                f"{self.severity_moderate}, {self.severity_critical}"
+            )
         if self.bluetooth_fallback_ports is None:
             self.bluetooth_fallback_ports = [
                 "/dev/ttyAMA2", 
@@ -119,8 +142,8 @@ class SystemConfig:
     def from_file(cls, config_path: str) -> 'SystemConfig':
         """Load configuration from JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                config_dict = json.load(f)
+            raw = Path(config_path).read_bytes()
+            config_dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
             return cls(**config_dict)
         except FileNotFoundError:
             logging.warning(f"Config file {config_path} not found, using defaults")
@@ -130,8 +153,59 @@ class SystemConfig:
             return cls()
 
 
+# Severity names in ascending depth order; index = bisect over the upper bounds
+_SEVERITY_NAMES = ("Minor", "Moderate", "Critical")
+
+
+class SizeTrackedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps a running byte count of the file instead of
+    seeking to its end on every record; the size is read from disk once at startup.
+    """
+    
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._bytes = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes = 0
+    
+    def emit(self, record):
+        try:
+            # Format once; the same string is measured and written
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # The stream's encoding, not self.encoding, which may be the 'locale' placeholder
+            size = len(msg.encode(self.stream.encoding, 'replace'))
+            if self.maxBytes > 0 and self._bytes and self._bytes + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self._bytes += size
+            self.stream.write(msg)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def doRollover(self):
+        super().doRollover()
+        self._bytes = 0
+
+
 class LoggerSetup:
-    """Centralized logging configuration."""
+    """
+    Centralized logging configuration.
+    
+    Callers enqueue records through a QueueHandler. Its prepare() still runs on
+    the calling thread: it merges msg % args and formats any exception text.
+    Handler formatting, rotation checks and disk/console writes happen on a
+    QueueListener thread, off the detection path.
+    """
+    
+    _listener: Optional[logging.handlers.QueueListener] = None
     
     @staticmethod
     def setup_logging(config: SystemConfig) -> logging.Logger:
@@ -160,7 +234,7 @@ class LoggerSetup:
         )
         
         # File handler with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = SizeTrackedRotatingFileHandler(
             log_dir / 'pothole_system.log',
             maxBytes=config.log_max_bytes,
             backupCount=config.log_backup_count
@@ -169,7 +243,7 @@ class LoggerSetup:
         file_handler.setFormatter(detailed_formatter)
         
         # Error file handler
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = SizeTrackedRotatingFileHandler(
             log_dir / 'pothole_errors.log',
             maxBytes=config.log_max_bytes,
             backupCount=config.log_backup_count
@@ -177,33 +251,75 @@ class LoggerSetup:
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(detailed_formatter)
         
-        # Detection events handler
-        detection_handler = logging.handlers.RotatingFileHandler(
+        # Detection events handler: only records from the 'detection' child logger
+        # (a logger-name prefix check, done on the listener thread)
+        detection_handler = SizeTrackedRotatingFileHandler(
             log_dir / 'pothole_detections.log',
             maxBytes=config.log_max_bytes,
             backupCount=config.log_backup_count
         )
         detection_handler.setLevel(logging.INFO)
         detection_handler.setFormatter(detailed_formatter)
-        detection_handler.addFilter(lambda record: 'DETECTION' in record.getMessage())
+        detection_handler.addFilter(logging.Filter(f'{logger.name}.detection'))
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(simple_formatter)
         
-        # Add handlers
-        logger.addHandler(file_handler)
-        logger.addHandler(error_handler)
-        logger.addHandler(detection_handler)
-        logger.addHandler(console_handler)
+        # Add handlers behind the queue
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, detection_handler, console_handler,
+            respect_handler_level=True
+        )
+        listener.start()
+        LoggerSetup._listener = listener
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
         
         return logger
+    
+    @staticmethod
+    def stop_logging(logger: logging.Logger):
+        """Flush queued records and stop the listener thread."""
+        listener = LoggerSetup._listener
+        if listener is None:
+            return
+        LoggerSetup._listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        # Allow setup_logging to build a fresh pipeline later
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                logger.removeHandler(handler)
 
 
 class PotholeSystem:
     """Main class for the Pothole Detection System with optimizations."""
 
+    RAW_LOG_BATCH = 256  # raw LiDAR rows per ring write
+    RAW_LOG_DTYPE = np.dtype([('t', 'f8'), ('d', 'f4')])  # wall-clock seconds, distance cm
+    RAW_LOG_QUEUE_SIZE = 4096  # raw LiDAR rows waiting for the writer thread
+    ML_CACHE_SIZE = 512  # recent event fingerprints kept for classification reuse
+    ML_CACHE_TTL = 60.0  # seconds before a cached classification goes stale
+    GSM_QUEUE_SIZE = 64  # pending pothole records awaiting GSM upload
+    GSM_BATCH_SIZE = 8  # records sent per GSM HTTP session
+    JSON_HEADERS = {"Content-Type": "application/json"}
+    EVENT_QUEUE_SIZE = 8  # closed events waiting for analysis/upload on the EventWorker thread
+    GSM_MAX_RETRIES = 3  # attempts per batch before it is dropped (backoff 2s, 4s, ...)
+    # Event depth buffer capacity: covers the 3 s event timeout even at the
+    # TF02-Pro's 1 kHz maximum frame rate, so a full event is never truncated
+    MAX_EVENT_SAMPLES = 4096
+    BASELINE_WINDOW = 20  # samples in the rolling-median road baseline (float32 ring)
+    # Bluetooth command byte value -> MotorController method name
+    BT_COMMANDS = {
+        ord(key): name
+        for letter, name in (('f', 'forward'), ('b', 'backward'), ('l', 'left'),
+                             ('r', 'right'), ('s', 'stop'))
+        for key in (letter, letter.upper())
+    }
+
     def __init__(self, config: Optional[SystemConfig] = None):
         """
         Initializes the system.
@@ -213,6 +329,10 @@ class PotholeSystem:
         """
         self.config = config or SystemConfig()
         self.logger = LoggerSetup.setup_logging(self.config)
+        # Confirmed detections, also written to pothole_detections.log
+        self.det_logger = self.logger.getChild('detection')
+        # Levels are fixed after setup: skip building debug messages entirely when off
+        self._log_debug = self.logger.isEnabledFor(logging.DEBUG)
         
         self.logger.info("=" * 60)
         self.logger.info("Initializing Pothole Detection System")
@@ -220,15 +340,16 @@ class PotholeSystem:
         
         # Thread-safe shutdown flag
         self._shutdown_event = threading.Event()
-        self._lock = threading.Lock()
         
-        # Statistics
+        # Statistics. Counters are bumped from several threads, so increments
+        # go through _count() under a lock
         self.stats = {
             'detections': 0,
             'false_positives': 0,
             'errors': 0,
             'start_time': time.time()
         }
+        self._stats_lock = threading.Lock()
         
         # Initialize GPIO
         try:
@@ -245,13 +366,78 @@ class PotholeSystem:
         self.motors = self._init_motors()
         self.ml_model = self._init_ml_model()
         
+        # Device handles used on the detection path, bound once (None when absent)
+        self._ultrasonic = self.sensors.get('ultrasonic')
+        self._gps = self.sensors.get('gps')
+        self._camera = self.comms.get('camera')
+        self._gsm = self.comms.get('gsm')
+        
+        # Preallocated baseline window and per-event depth buffer (int16 mm) for
+        # the compiled detector; compile it now so the first frame doesn't pay the JIT cost
+        self._detector = DetectorState(window_size=self.BASELINE_WINDOW,
+                                       max_event_samples=self.MAX_EVENT_SAMPLES)
+        self._detector.warm_up()
+        
+        # One analyzer for the whole run instead of one per event
+        self._analyzer = None
+        if PotholeAnalyzer is not None:
+            self._analyzer = PotholeAnalyzer(
+                vehicle_speed=self.config.estimated_speed,
+                sensor_height=5.0, # Updated to 5cm as per user
+                sampling_rate=50.0 # Updated to 50Hz
+            )
+            # Warm run on a small synthetic dip so the first real event skips NumPy's first-call setup
+            self._analyzer.analyze_pothole(np.array([0.5, 3.0, 6.0, 6.5, 3.0, 0.5]), 0.12)
+        
+        # Config values read on every event, resolved once
+        self._threshold = self.config.pothole_threshold
+        self._speed = self.config.estimated_speed
+        self._api_url = f"{self.config.backend_url}/api/potholes"
+        
+        # Upper bounds of the Minor and Moderate bands for bisect lookup
+        self._severity_edges = (self.config.severity_minor[1], self.config.severity_moderate[1])
+        
+        # fingerprint -> (classification, monotonic time), oldest first
+        self._ml_cache = OrderedDict()
+        
+        # Raw LiDAR logging: detection loop -> queue -> writer thread, so a page
+        # fault on the memmap ring never stalls sampling; the writer owns the
+        # batch buffer and the ring
+        self._raw_log_queue = queue.Queue(maxsize=self.RAW_LOG_QUEUE_SIZE)
+        self._raw_log_dropped = 0
+        self._raw_log_buf = []
+        self._raw_log_last_flush = time.time()
+        self._raw_ring = None
+        self._raw_ring_day = None
+        self._raw_log_thread = None
+        if self.config.enable_raw_lidar_logging:
+            self._raw_log_thread = threading.Thread(
+                target=self._raw_log_writer, name="RawLidarLog", daemon=True
+            )
+            self._raw_log_thread.start()
+        
         # Road Profile Buffering
         self.road_buffer = []
         self.session_id = str(uuid.uuid4())
         self.road_buffer_lock = threading.Lock()
         
-        # Start background uploader
+        # Pothole records for the GSM worker; one thread owns the modem so AT
+        # command sequences from consecutive events never interleave
+        self._gsm_queue = queue.Queue(maxsize=self.GSM_QUEUE_SIZE)
+        self._gsm_thread = None
+        self._bt_thread = None  # started by run()
+        
+        # Closed events (readings copied out of the detector buffer) for the
+        # EventWorker: analysis, GPS, ML and upload never stall LiDAR sampling
+        self._event_queue = queue.Queue(maxsize=self.EVENT_QUEUE_SIZE)
+        self._event_thread = threading.Thread(target=self._event_worker, name="EventWorker", daemon=True)
+        self._event_thread.start()
+        
+        # Start background uploaders
         threading.Thread(target=self._upload_road_profile_loop, daemon=True).start()
+        if self.comms.get('gsm'):
+            self._gsm_thread = threading.Thread(target=self._gsm_upload_loop, name="GSMUpload", daemon=True)
+            self._gsm_thread.start()
         self._init_local_db() # Ensure local DB is ready
 
         self.logger.info("System initialization complete")
@@ -272,8 +458,22 @@ class PotholeSystem:
             sensors['ultrasonic'] = None
         
         try:
-            sensors['gps'] = GPS()
-            self.logger.info("✓ GPS module initialized")
+            # Separate process: NMEA parsing stays off the detection loop's GIL
+            gps = SharedGPS()
+            if gps.wait_ready(self.config.gps_start_timeout):
+                sensors['gps'] = gps
+                self.logger.info("✓ GPS module initialized")
+            else:
+                # Stop the child first so it releases the port, then read in-process
+                gps.stop()
+                self.logger.warning("GPS process did not start; falling back to in-process GPS")
+                gps = GPS()
+                if gps.gps:
+                    sensors['gps'] = gps
+                    self.logger.info("✓ GPS module initialized (in-process)")
+                else:
+                    sensors['gps'] = None
+                    self.logger.error("✗ GPS module failed: no GPS port could be opened")
         except Exception as e:
             self.logger.error(f"✗ GPS module failed: {e}")
             sensors['gps'] = None
@@ -354,7 +554,8 @@ class PotholeSystem:
         # Fallback to hardware serial ports
         for port in self.config.bluetooth_fallback_ports:
             try:
-                bt = serial.Serial(port, self.config.bluetooth_baud_rate, timeout=1)
+                # timeout=None: reads block until a command byte arrives
+                bt = serial.Serial(port, self.config.bluetooth_baud_rate, timeout=None)
                 self.logger.info(f"✓ Bluetooth initialized on {port}")
                 return bt
             except serial.SerialException:
@@ -377,8 +578,11 @@ class PotholeSystem:
         """Initialize ML model with configuration check."""
         self.logger.info("Loading ML model...")
         try:
+            started = time.perf_counter()
             model = SensorMLInference(model_path=self.config.model_path)
             self.logger.info(f"✓ ML model loaded from {self.config.model_path}")
+            if self._log_debug:
+                self.logger.debug(f"ML model load + warm-up took {(time.perf_counter() - started) * 1000:.0f}ms")
             return model
         except Exception as e:
             self.logger.error(f"✗ ML model loading failed: {e}")
@@ -390,6 +594,11 @@ class PotholeSystem:
             self.logger.warning("ML model not loaded. Classification will be skipped.")
             return None
 
+    def reload_ml_model(self):
+        """Reload the ML model from disk and drop classifications made by the old one."""
+        self.ml_model = self._init_ml_model()
+        self._ml_cache.clear()
+
     def bluetooth_control(self):
         """Listens for bluetooth commands and controls the motors."""
         if not self.comms.get('bluetooth') or not self.motors:
@@ -397,30 +606,39 @@ class PotholeSystem:
             return
         
         self.logger.info("Bluetooth control thread started")
-        command_map = {
-            'f': ('forward', self.motors.forward),
-            'b': ('backward', self.motors.backward),
-            'l': ('left', self.motors.left),
-            'r': ('right', self.motors.right),
-            's': ('stop', self.motors.stop)
+        bt = self.comms['bluetooth']
+        # Jump table keyed on the raw byte value: no per-command bytes/str objects
+        command_table = {
+            code: (name, getattr(self.motors, name))
+            for code, name in self.BT_COMMANDS.items()
         }
         
+        # A hardware port can report how many more bytes are already buffered
+        buffered = isinstance(bt, serial.Serial)
+        
         while not self._shutdown_event.is_set():
             try:
-                if self.comms['bluetooth'].in_waiting > 0:
-                    cmd = self.comms['bluetooth'].read().decode().lower()
-                    
-                    if cmd in command_map:
-                        name, action = command_map[cmd]
-                        action()
-                        self.logger.debug(f"Bluetooth command: {name}")
-                    else:
-                        self.logger.debug(f"Unknown bluetooth command: {cmd}")
+                # Blocks in the kernel until a byte arrives; shutdown() cancels the read
+                cmds = bt.read(1)
+                if not cmds:
+                    continue
+                # Take any commands that queued up behind it in the same wakeup
+                if buffered and bt.in_waiting:
+                    cmds += bt.read(bt.in_waiting)
                 
-                time.sleep(0.05)
+                for code in cmds:
+                    entry = command_table.get(code)
+                    if entry:
+                        name, action = entry
+                        action()
+                        if self._log_debug:
+                            self.logger.debug(f"Bluetooth command: {name}")
+                    elif self._log_debug:
+                        self.logger.debug(f"Unknown bluetooth command: {bytes([code])!r}")
                 
-            except (serial.SerialException, UnicodeDecodeError) as e:
-                self.logger.error(f"Bluetooth error: {e}")
+            except serial.SerialException as e:
+                if not self._shutdown_event.is_set():
+                    self.logger.error(f"Bluetooth error: {e}")
                 break
             except Exception as e:
                 self.logger.error(f"Unexpected bluetooth error: {e}")
@@ -439,136 +657,181 @@ class PotholeSystem:
         
         # High-Speed Config
         SAMPLING_INTERVAL = 0.02  # 20ms = 50Hz
+        lidar = self.sensors['lidar']
+        # A hardware UART streams frames on its own clock: block until frames
+        # arrive instead of polling. SoftwareSerial keeps the paced 50Hz polling.
+        streaming = isinstance(lidar.ser, serial.Serial)
+        # The LiDAR streams at 100Hz or more, but BASELINE_WINDOW, the 3-sample
+        # glitch filter and the analyzer are tuned for 50Hz: streamed frames are
+        # decimated to that rate before they reach the detector
+        sample_interval_ns = int(SAMPLING_INTERVAL * 1e9) if streaming else 0
+        next_sample_ns = 0
         
-        # Rolling Buffers
-        baseline_window = []
-        baseline_window_size = 20
-        baseline_distance = None
+        # Rolling baseline window + event buffer (compiled, see _detect_kernel.py)
+        detector = self._detector
+        window, ranked = detector.window, detector.ranked
+        events, counts, levels = detector.events, detector.counts, detector.levels
         
-        # Event Tracking
-        event_readings = []
-        event_start_time = 0
+        # Event Tracking (monotonic ns: immune to NTP steps mid-event)
+        event_start_ns = 0
+        EVENT_TIMEOUT_NS = 3_000_000_000
         in_pothole_event = False
         loop_count = 0
         
+        camera = self._camera
+        ultrasonic = self._ultrasonic
+        event_put = self._event_queue.put_nowait
+        
+        # Hot-loop locals: bound methods and config values resolved once
+        # (on a hardware UART read_batch drains every queued frame in one call)
+        read_samples = lidar.read_batch
+        log_raw = self._log_raw_lidar if self.config.enable_raw_lidar_logging else None
+        raw_decimation = max(1, self.config.raw_lidar_event_decimation)
+        raw_skip = 0
+        threshold = self._threshold
+        is_shutdown = self._shutdown_event.is_set
+        process = process_sample
+        clock_ns = time.monotonic_ns
+        pace = time.monotonic  # pacing deadlines are immune to wall-clock steps
+        # Raw log rows need wall-clock time; derive it from the monotonic reading
+        # with an offset re-synced once a second (picks up NTP corrections)
+        wall_offset_ns = 0
+        next_wall_sync_ns = 0  # sync on the first sample
+        sleep = time.sleep
+        
         # Performance Monitoring
-        next_loop_time = time.time()
+        next_loop_time = pace()
         
-        while not self._shutdown_event.is_set():
+        while not is_shutdown():
             try:
-                loop_start = time.time()
-                
-                # 1. FAST LiDAR Read
-                # We expect the sensor class to handle raw buffering
-                lidar_dist_m = self.sensors['lidar'].get_distance()
-                
-                # If LiDAR misses, don't block, just skip frame (maintain 50Hz cadence)
-                if lidar_dist_m is None:
-                    # Busy wait for next slot to maintain timing precision
-                    while time.time() < next_loop_time:
-                         time.sleep(0.001) 
-                    next_loop_time += SAMPLING_INTERVAL
-                    continue
-
-                lidar_cm = (lidar_dist_m * 100) - 5.0 # User requested offset
-                lidar_cm = max(0.0, lidar_cm) # Ensure no negative distance
-                
-                # 2. Raw 3D Logging (for Dashboard Point Cloud)
-                if self.config.enable_raw_lidar_logging:
-                    self._log_raw_lidar(lidar_cm)
-
-                # 3. Dynamic Baseline Tracking (The "Ground" Level)
-                if not in_pothole_event:
-                    baseline_window.append(lidar_cm)
-                    if len(baseline_window) > baseline_window_size:
-                        baseline_window.pop(0)
+                # 1. FAST LiDAR Read (empty if the LiDAR missed; never blocks past the port timeout)
+                for lidar_dist_m in read_samples():
+                    # One clock read per sample, shared by the log row and event timing
+                    now_ns = clock_ns()
+                    if now_ns < next_sample_ns:
+                        continue
+                    next_sample_ns += sample_interval_ns
+                    if next_sample_ns <= now_ns:
+                        # Behind (first frame, or a stall): restart the grid from now
+                        next_sample_ns = now_ns + sample_interval_ns
+                    lidar_cm = (lidar_dist_m * 100) - 5.0 # User requested offset
+                    lidar_cm = max(0.0, lidar_cm) # Ensure no negative distance
                     
-                    if len(baseline_window) >= 10:
-                        # Fast median approximation
-                        sorted_window = sorted(baseline_window)
-                        baseline_distance = sorted_window[len(sorted_window)//2]
-
-                # 4. Calculate Depth
-                depth = 0.0
-                if baseline_distance:
-                    depth = lidar_cm - baseline_distance
-
-                # 5. POTHOLE LOGIC with Noise Filtering
-                # Determine if current sample is a trigger
-                is_trigger = depth > self.config.pothole_threshold
-
-                if is_trigger:
-                    if not in_pothole_event:
-                        # Improved Trigger: Require 3 consecutive hits to confirm start (Noise Filter)
-                        # We use a temporary counter `consecutive_triggers` here? 
-                        # Or simpler: store potential start time.
-                        # Let's use a simpler approach: Just start, but discard short events later.
-                        
+                    # 2. Raw 3D Logging (for Dashboard Point Cloud)
+                    # Load shedding: while an event is open only every Nth point is
+                    # logged, keeping the event-capture path short
+                    if in_pothole_event:
+                        raw_skip += 1
+                    if log_raw is not None and (not in_pothole_event or raw_skip % raw_decimation == 0):
+                        if now_ns >= next_wall_sync_ns:
+                            wall_offset_ns = time.time_ns() - now_ns
+                            next_wall_sync_ns = now_ns + 1_000_000_000
+                        log_raw(lidar_cm, (now_ns + wall_offset_ns) * 1e-9)
+
+                    # 3-5. Dynamic Baseline Tracking (rolling median "Ground" level), Depth
+                    # and POTHOLE LOGIC in one compiled call; Python only runs below
+                    # when an event starts or ends
+                    depth, in_pothole_event, status = process(
+                        lidar_cm, threshold, in_pothole_event, window, ranked, events, counts, levels
+                    )
+
+                    if status == EVENT_STARTED:
                         # --- START OF EVENT ---
-                        in_pothole_event = True
-                        event_start_time = time.time()
-                        self.logger.info(f"⚡ POTHOLE TRIGGER: {depth:.1f}cm depth (Baseline: {baseline_distance:.1f}cm)")
+                        event_start_ns = now_ns
+                        self.logger.info("⚡ POTHOLE TRIGGER: %.1fcm depth (Baseline: %.1fcm)", depth, levels[0])
                         
                         # TRIGGER CAMERA INSTANTLY (latency critical)
-                        if self.comms.get('camera'):
-                             threading.Thread(target=self.comms['camera'].trigger).start()
+                        if camera:
+                             threading.Thread(target=camera.trigger).start()
+
+                    elif status == EVENT_CLOSED:
+                        # --- END OF EVENT ---
+                        # Filter short glitches (< 3 samples)
+                        if detector.event_count >= 3: 
+                             # FUSE ULTRASONIC DATA HERE (Backup Validtion)
+                             us_depth = 0
+                             baseline_distance = detector.baseline
+                             if ultrasonic:
+                                 us_dist = ultrasonic.get_distance()
+                                 if us_dist and baseline_distance:
+                                     us_depth = us_dist - baseline_distance
+
+                             # take_event() copies the readings out, so the detector
+                             # buffer is free for the next event straight away
+                             stats = detector.event_stats()
+                             try:
+                                 event_put((detector.take_event(), stats,
+                                            (now_ns - event_start_ns) * 1e-9, time.time(), us_depth))
+                             except queue.Full:
+                                 detector.discard_event()
+                                 self.logger.warning("Event worker backlog full, pothole event dropped")
+                        else:
+                            self.logger.debug("Ignored short glitch (%d samples)", counts[2])
+                            self._count('false_positives')
+                            detector.discard_event()
 
-                    event_readings.append(depth)
-                    
                     # TIMEOUT CHECK: If hole lasts > 3s, it's likely a sensor lift/terrain change
-                    if (time.time() - event_start_time) > 3.0:
+                    if in_pothole_event and now_ns - event_start_ns > EVENT_TIMEOUT_NS:
                         self.logger.warning("⚠️ Event timeout (>3s). Interpreting as terrain change/lift. Resetting baseline.")
                         in_pothole_event = False
-                        event_readings = []
-                        baseline_window = [lidar_cm] # Fast reset to current level
-                        baseline_distance = lidar_cm
-
-                elif in_pothole_event:
-                    # --- END OF EVENT ---
-                    in_pothole_event = False
-                    duration = time.time() - event_start_time
-                    
-                    # Filter short glitches (< 3 samples approx 60ms)
-                    if len(event_readings) >= 3: 
-                         # FUSE ULTRASONIC DATA HERE (Backup Validtion)
-                         us_depth = 0
-                         if self.sensors.get('ultrasonic'):
-                             us_dist = self.sensors['ultrasonic'].get_distance()
-                             if us_dist and baseline_distance:
-                                 us_depth = us_dist - baseline_distance
-
-                         self._handle_pothole_event(event_readings, event_start_time, us_depth_validation=us_depth)
-                    else:
-                        self.logger.debug(f"Ignored short glitch ({len(event_readings)} samples)")
-                    
-                    event_readings = []
-
-                # 6. Precision Timing (50Hz)
-                next_loop_time += SAMPLING_INTERVAL
-                sleep_time = next_loop_time - time.time()
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                        detector.reset_baseline(lidar_cm) # Fast reset to current level
 
             except Exception as e:
                 self.logger.error(f"Loop error: {e}")
-                time.sleep(0.05)
+                self._count('errors')
+                if streaming:
+                    # No pacing below on this path; don't spin on a persistent fault
+                    sleep(SAMPLING_INTERVAL)
+
+            # 6. Precision Timing (50Hz, polled sensors only; errors fall through here too)
+            if streaming:
+                continue
+            # Absolute deadlines: work time doesn't push the next sample later
+            next_loop_time += SAMPLING_INTERVAL
+            sleep_time = next_loop_time - pace()
+            if sleep_time > 0:
+                sleep(sleep_time)
+            else:
+                # Fell behind (e.g. event analysis): resync instead of bursting
+                next_loop_time = pace()
+
 
+    def _event_worker(self):
+        """Background thread running _handle_pothole_event for queued events. Stops on a None sentinel."""
+        while True:
+            item = self._event_queue.get()
+            if item is None:
+                break
+            readings, stats, duration, detected_at, us_depth = item
+            try:
+                self._handle_pothole_event(readings, stats, duration, detected_at,
+                                           us_depth_validation=us_depth)
+            except Exception as e:
+                self.logger.error(f"Event processing error: {e}")
+                self._count('errors')
 
-    def _handle_pothole_event(self, readings: List[float], start_time: float, us_depth_validation=0):
+    def _handle_pothole_event(self, readings: np.ndarray, stats: tuple, duration: float,
+                              detected_at: float, us_depth_validation=0):
         """
-        Process event and send 3D-ready data to backend.
+        Process event and send 3D-ready data to backend. Runs on the EventWorker thread.
+        
+        Args:
+            readings: Event depths in integer millimetres (int16)
+            stats: (peak, mean, std) depth in cm, accumulated by the detector
+                   while the event was recorded
+            duration: Event duration in seconds
+            detected_at: Epoch time the event closed (processing may run later)
         """
-        duration = time.time() - start_time
+        self._count('detections')
+        # Shared by the payload and the ML feature vector; no extra pass over readings
+        peak_depth, mean_depth, std_depth = stats
+        # cm, float64 (what PotholeAnalyzer works in). Dividing whole mm by 10 gives
+        # the nearest double to each 0.1cm value, so the profile needs no rounding pass
+        readings = readings / 10.0
         
         # 1. Advanced Measurement Analysis
-        try:
-            from pothole_measurement import PotholeAnalyzer
-            analyzer = PotholeAnalyzer(
-                vehicle_speed=self.config.estimated_speed,
-                sensor_height=5.0, # Updated to 5cm as per user
-                sampling_rate=50.0 # Updated to 50Hz
-            )
-            measurement = analyzer.analyze_pothole(readings, duration)
+        if self._analyzer is not None:
+            measurement = self._analyzer.analyze_pothole(readings, duration)
             
             max_depth = measurement.max_depth
             length = measurement.length
@@ -576,9 +839,9 @@ class PotholeSystem:
             volume = measurement.volume
             confidence = measurement.confidence
             
-        except ImportError:
-            max_depth = max(readings)
-            length = duration * self.config.estimated_speed
+        else:
+            max_depth = peak_depth
+            length = duration * self._speed
             width = length * 0.85
             volume = (length * width * max_depth) / 2
             confidence = 0.5
@@ -595,7 +858,7 @@ class PotholeSystem:
             "latitude": coords['lat'],
             "longitude": coords['lon'],
             "depth": round(max_depth, 2),
-            "avg_depth": round(sum(readings)/len(readings), 2),
+            "avg_depth": round(mean_depth, 2),
             "length": round(length, 2),
             "width": round(width, 2),
             "volume": round(volume, 2),
@@ -604,57 +867,94 @@ class PotholeSystem:
             "sensor_fusion": {
                 "lidar_depth": round(max_depth, 2),
                 "ultrasonic_depth": round(us_depth_validation, 2) if us_depth_validation else None,
-                "backup_confirmed": (us_depth_validation > self.config.pothole_threshold) if us_depth_validation else False
+                "backup_confirmed": (us_depth_validation > self._threshold) if us_depth_validation else False
             },
-            "timestamp": datetime.now().isoformat(),
+            # Local-time ISO 8601 (seconds), as the backend's fromisoformat() expects
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(detected_at)),
             "gps_fixed": coords['fixed'],
             "3d_view": True,
-            "profile": [round(x, 1) for x in readings]  # Raw depth profile for 3D plotting
+            "profile": readings.tolist()  # Raw depth profile for 3D plotting
         }
 
         # 3a. Classification (Non-blocking)
         if self.ml_model:
              try:
-                 data["classification"] = self.ml_model.classify_event(readings, duration)
+                 data["classification"] = self._classify_event(mean_depth, peak_depth, std_depth, duration,
+                                                                 len(readings))
              except:
                  data["classification"] = "pothole"
         else:
              data["classification"] = "pothole"
 
-        self.logger.info(
-            f"🚀 DETECTED POTHOLE!\n"
-            f"   📏 Dimensions: {length:.2f}cm (L) x {width:.2f}cm (W) x {max_depth:.2f}cm (D)\n"
-            f"   📦 Volume: {volume:.0f}cm³ | Severity: {severity}"
+        self.det_logger.info(
+            "🚀 DETECTED POTHOLE!\n"
+            "   📏 Dimensions: %.2fcm (L) x %.2fcm (W) x %.2fcm (D)\n"
+            "   📦 Volume: %.0fcm³ | Severity: %s",
+            length, width, max_depth, volume, severity
         )
 
         # 4. SEND (Trigger GSM/Backend)
+        # Serialize once (orjson when installed); HTTP and GSM send the same bytes
+        body = encode_json(data)
+        
         # 4a. HTTP Upload (Preferred for Dashboard)
-        threading.Thread(target=self._send_pothole_http, args=(data,)).start()
+        threading.Thread(target=self._send_pothole_http, args=(body,)).start()
 
         # 4b. GSM Upload (Backup/Remote)
-        if self.comms.get('gsm'):
-            # Run in thread to not block next detection
-            threading.Thread(target=self.comms['gsm'].send_data, args=(data,)).start()
+        if self._gsm:
+            # Hand off to the GSM worker so the detection loop never waits on the modem
+            try:
+                self._gsm_queue.put_nowait(body)
+            except queue.Full:
+                self.logger.warning(f"GSM upload queue full, record not sent: {body.decode()}")
         else:
             self.logger.warning("GSM not available, data not sent")
         
         # Camera confirmation (non-blocking)
-        if self.comms.get('camera'):
+        if self._camera:
             try:
                 threading.Thread(
-                    target=self.comms['camera'].wait_for_confirmation,
+                    target=self._camera.wait_for_confirmation,
                     daemon=True
                 ).start()
             except Exception as e:
                 self.logger.error(f"Camera confirmation error: {e}")
 
-    def _send_pothole_http(self, data: Dict[str, Any]):
+    def _classify_event(self, mean_depth: float, peak_depth: float, std_depth: float,
+                        duration: float, n_samples: int) -> str:
+        """
+        Classify an event from its precomputed features, reusing the result for
+        a recent event with the same coarse fingerprint (max/mean depth and
+        duration to 0.1, sample count in buckets of 5).
+        """
+        key = (round(peak_depth, 1), round(mean_depth, 1), round(duration, 1), n_samples // 5)
+        now = time.monotonic()
+        cache = self._ml_cache
+        
+        hit = cache.get(key)
+        if hit is not None and now - hit[1] < self.ML_CACHE_TTL:
+            cache.move_to_end(key)
+            if self._log_debug:
+                self.logger.debug(f"ML cache hit: {key} -> {hit[0]}")
+            return hit[0]
+        
+        classification = self.ml_model.classify_features(mean_depth, peak_depth, std_depth, duration)
+        cache[key] = (classification, now)
+        cache.move_to_end(key)
+        if len(cache) > self.ML_CACHE_SIZE:
+            cache.popitem(last=False)
+        return classification
+
+    def _send_pothole_http(self, body: bytes):
         """
         Sends pothole data directly to backend via HTTP (Faster than GSM).
+        
+        Args:
+            body: The pothole record, already encoded as JSON
         """
         try:
             # Use configured backend URL
-            api_url = f"{self.config.backend_url}/api/potholes"
+            api_url = self._api_url
             
             # Use localhost if running in simulation or development
             try:
@@ -662,28 +962,75 @@ class PotholeSystem:
                     api_url = "http://127.0.0.1:8000/api/potholes"
             except: pass
 
-            self.logger.debug(f"📤 Uploading to {api_url}...")
-            response = requests.post(api_url, json=data, timeout=3)
+            if self._log_debug:
+                self.logger.debug(f"📤 Uploading to {api_url}...")
+            response = requests.post(api_url, data=body, headers=self.JSON_HEADERS, timeout=3)
             
             if response.status_code == 200:
-                self.logger.info(f"✅ HTTP Upload Success: ID {response.json().get('id')}")
+                self.logger.info("✅ HTTP Upload Success: ID %s", response.json().get('id'))
             else:
                 self.logger.warning(f"⚠️ HTTP Upload Failed: {response.status_code} - {response.text}")
                 
         except Exception as e:
             self.logger.error(f"❌ HTTP Upload Error: {e}")
 
+    def _gsm_upload_loop(self):
+        """
+        Background thread draining queued pothole records to the GSM module in
+        batches. After shutdown is signalled it keeps going until the queue is
+        empty (shutdown() bounds the wait), but no longer retries.
+        """
+        gsm = self.comms['gsm']
+        shutdown = self._shutdown_event
+        while True:
+            try:
+                batch = [self._gsm_queue.get(timeout=0.5 if shutdown.is_set() else 2.0)]
+            except queue.Empty:
+                if shutdown.is_set():
+                    return
+                continue
+            
+            while len(batch) < self.GSM_BATCH_SIZE:
+                try:
+                    batch.append(self._gsm_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            pending = batch
+            for attempt in range(1, self.GSM_MAX_RETRIES + 1):
+                try:
+                    # Only the records the backend did not acknowledge come back
+                    pending = gsm.send_batch(pending)
+                except Exception as e:
+                    # UART failure mid-batch: no way to tell what got through, retry it all
+                    self.logger.error(f"GSM upload error (attempt {attempt}/{self.GSM_MAX_RETRIES}): {e}")
+                if not pending:
+                    if self._log_debug:
+                        self.logger.debug(f"GSM: sent {len(batch)} record(s)")
+                    break
+                self.logger.warning(
+                    f"GSM: {len(pending)}/{len(batch)} record(s) not acknowledged "
+                    f"(attempt {attempt}/{self.GSM_MAX_RETRIES})")
+                # Back off before retrying; shutdown cuts the wait short
+                if attempt == self.GSM_MAX_RETRIES or shutdown.wait(2.0 ** attempt):
+                    self.logger.warning(f"GSM: dropped {len(pending)} record(s)")
+                    break
+
     def _get_gps_coordinates(self) -> Optional[Dict[str, Any]]:
         """Get GPS coordinates with error handling."""
-        if not self.sensors.get('gps'):
+        gps = self._gps
+        if not gps:
             # self.logger.warning("GPS sensor not available") # removed to reduce log noise
             return None
         
         try:
-            coords = self.sensors['gps'].get_location()
+            coords = gps.get_location()
+            if coords is None:
+                self.logger.warning("GPS process not running")
+                return None
             
             if coords['fixed']:
-                self.logger.info(f"GPS: {coords['lat']:.6f}, {coords['lon']:.6f}")
+                self.logger.info("GPS: %.6f, %.6f", coords['lat'], coords['lon'])
             else:
                 self.logger.warning("GPS fix not available")
             
@@ -788,12 +1135,12 @@ class PotholeSystem:
         Returns:
             Severity level string
         """
-        if self.config.severity_minor[0] <= depth < self.config.severity_minor[1]:
-            return "Minor"
-        elif self.config.severity_moderate[0] <= depth < self.config.severity_moderate[1]:
-            return "Moderate"
-        else:
-            return "Critical"
+        return _SEVERITY_NAMES[bisect_right(self._severity_edges, depth)]
+
+    def _count(self, name: str):
+        """Increment a statistics counter."""
+        with self._stats_lock:
+            self.stats[name] += 1
 
     def _log_statistics(self):
         """Log system statistics."""
@@ -810,29 +1157,137 @@ class PotholeSystem:
         self.logger.info(f"Detection Rate: {self.stats['detections']/hours:.2f} per hour")
         self.logger.info("=" * 60)
 
-    def _log_raw_lidar(self, depth):
-        """Saves a single point to the secondary high-speed database."""
+    def _log_raw_lidar(self, depth, now):
+        """Queues a single point (taken at time `now`) for the secondary high-speed database."""
+        try:
+            self._raw_log_queue.put_nowait((now, depth))
+        except queue.Full:
+            # Writer has fallen far behind (SD card stall); drop rather than block sampling
+            self._raw_log_dropped += 1
+
+    def _raw_log_writer(self):
+        """Background thread batching queued raw LiDAR points into the ring file. Stops on a None sentinel."""
+        buf = self._raw_log_buf
+        get = self._raw_log_queue.get
+        while True:
+            try:
+                item = get(timeout=0.1)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                break
+            if item:
+                buf.append(item)
+            # One slice assignment per batch instead of a write per sample
+            if len(buf) >= self.RAW_LOG_BATCH or time.time() - self._raw_log_last_flush >= 1.0:
+                self._flush_raw_lidar()
+        self._flush_raw_lidar()
+        try:
+            self._close_raw_ring()
+        except Exception as e:
+            self.logger.error(f"Raw LiDAR log close failed: {e}")
+
+    def _open_raw_ring(self, day):
+        """
+        Maps the ring file for `day` (YYYYMMDD), creating it zero-filled if needed,
+        and deletes ring files older than raw_lidar_keep_days.
+        
+        The head comes from the .head sidecar written on close. The sidecar is
+        removed once read, so after a crash it is missing and the head resumes
+        after the newest timestamp in the ring instead.
+        """
+        base, ext = os.path.splitext(self.config.raw_lidar_log)
+        path = f"{base}_{day}{ext}"
+        size = self.config.raw_lidar_max_rows
+        reuse = os.path.exists(path) and os.path.getsize(path) == size * self.RAW_LOG_DTYPE.itemsize
+        ring = np.memmap(path, dtype=self.RAW_LOG_DTYPE, mode='r+' if reuse else 'w+', shape=(size,))
+        head = 0
+        if reuse:
+            sidecar = Path(path + '.head')
+            try:
+                head = int(sidecar.read_text()) % size
+                sidecar.unlink()
+            except (OSError, ValueError):
+                newest = int(ring['t'].argmax())
+                head = (newest + 1) % size if ring['t'][newest] > 0 else 0
+        self._raw_ring, self._raw_ring_path = ring, path
+        self._raw_ring_day, self._raw_ring_head = day, head
+        
+        # Day stamps sort as strings, so older files compare lower
+        cutoff = time.strftime('%Y%m%d', time.localtime(time.time() - self.config.raw_lidar_keep_days * 86400))
+        base_path = Path(base)
+        for old in base_path.parent.glob(f"{base_path.name}_*{ext}"):
+            if old.name[len(base_path.name) + 1:-len(ext) or None] < cutoff:
+                old.unlink(missing_ok=True)
+                Path(f"{old}.head").unlink(missing_ok=True)
+
+    def _close_raw_ring(self):
+        """Flushes the ring to disk and records its head in the .head sidecar."""
+        if self._raw_ring is None:
+            return
+        self._raw_ring.flush()
+        Path(self._raw_ring_path + '.head').write_text(str(self._raw_ring_head))
+        self._raw_ring = None
+        self._raw_ring_day = None
+
+    def _flush_raw_lidar(self):
+        """
+        Copies all buffered raw LiDAR points into the memmap ring.
+        
+        The ring is a fixed-size file of raw_lidar_max_rows (t, d) records, one
+        file per day. Writes are plain memory stores that the kernel writes back
+        lazily: no syscall or SQLite transaction per batch, and the file never
+        grows. Once full, the oldest records are overwritten in place.
+        """
+        self._raw_log_last_flush = time.time()
+        buf = self._raw_log_buf
+        if not buf:
+            return
         try:
-            if not hasattr(self, '_raw_db_conn'):
-                self._raw_db_conn = sqlite3.connect(self.config.raw_lidar_db, check_same_thread=False)
-                self._raw_db_cursor = self._raw_db_conn.cursor()
-                self._raw_db_cursor.execute("CREATE TABLE IF NOT EXISTS raw_data (timestamp REAL, depth REAL)")
+            # Rotate on the day boundary (local time of the newest point)
+            day = time.strftime('%Y%m%d', time.localtime(buf[-1][0]))
+            if day != self._raw_ring_day:
+                self._close_raw_ring()
+                self._open_raw_ring(day)
             
-            self._raw_db_cursor.execute("INSERT INTO raw_data VALUES (?, ?)", (time.time(), depth))
-            self._raw_db_conn.commit()
-        except: pass
+            ring = self._raw_ring
+            size = len(ring)
+            records = np.array(buf[-size:], dtype=self.RAW_LOG_DTYPE)
+            head = self._raw_ring_head
+            # At most two slice copies: up to the end of the file, then wrapped
+            first = min(len(records), size - head)
+            ring[head:head + first] = records[:first]
+            ring[:len(records) - first] = records[first:]
+            self._raw_ring_head = (head + len(records)) % size
+            self._raw_log_failing = False
+        except Exception as e:
+            # Once per failure streak: a full SD card would otherwise log every batch
+            if not getattr(self, '_raw_log_failing', False):
+                self._raw_log_failing = True
+                self.logger.error(f"Raw LiDAR log write failed, dropping batches until it recovers: {e}")
+        finally:
+            buf.clear()
 
     def run(self):
-        """Starts the pothole detection system with proper thread management."""
+        """
+        Starts the pothole detection system with proper thread management.
+        
+        Bluetooth control and detection stay on separate threads: both spend
+        their idle time blocked in serial reads, which release the GIL, so
+        neither thread wakes the other between bytes/frames. Multiplexing both
+        ports through one selector in detection_loop would save nothing while
+        idle, would queue motor commands behind event analysis, and is not
+        possible for SoftwareSerial, which has no file descriptor.
+        """
         self.logger.info("Starting pothole detection system...")
         
-        # Start bluetooth control thread
-        bt_thread = threading.Thread(
+        # Start bluetooth control thread (sleeps in read(1) until a command arrives)
+        self._bt_thread = threading.Thread(
             target=self.bluetooth_control,
             name="BluetoothControl",
             daemon=True
         )
-        bt_thread.start()
+        self._bt_thread.start()
         
         try:
             # Run main detection loop
@@ -855,6 +1310,23 @@ class PotholeSystem:
         # Log final statistics
         self._log_statistics()
         
+        # Write out any queued raw LiDAR rows
+        if self._raw_log_thread is not None:
+            try:
+                self._raw_log_queue.put(None, timeout=1.0)
+            except queue.Full:
+                pass
+            self._raw_log_thread.join(timeout=5.0)
+            if self._raw_log_dropped:
+                self.logger.warning(f"Raw LiDAR log dropped {self._raw_log_dropped} samples (writer behind)")
+        
+        # Finish queued pothole events (they feed the GSM queue below)
+        try:
+            self._event_queue.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        self._event_thread.join(timeout=5.0)
+        
         # Stop motors
         if self.motors:
             try:
@@ -871,8 +1343,10 @@ class PotholeSystem:
             except Exception as e:
                 self.logger.error(f"Error stopping GPS: {e}")
         
-        # Close GSM
+        # Close GSM (after giving the worker a bounded chance to flush its queue)
         if self.comms.get('gsm'):
+            if self._gsm_thread is not None:
+                self._gsm_thread.join(timeout=10.0)
             try:
                 self.comms['gsm'].close()
                 self.logger.info("GSM closed")
@@ -882,6 +1356,11 @@ class PotholeSystem:
         # Close Bluetooth
         if self.comms.get('bluetooth'):
             try:
+                # Wake the control thread out of its blocking read before closing
+                if hasattr(self.comms['bluetooth'], 'cancel_read'):
+                    self.comms['bluetooth'].cancel_read()
+                if self._bt_thread is not None:
+                    self._bt_thread.join(timeout=2.0)
                 self.comms['bluetooth'].close()
                 self.logger.info("Bluetooth closed")
             except Exception as e:
@@ -896,6 +1375,7 @@ class PotholeSystem:
         
         self.logger.info("Shutdown complete")
         self.logger.info("=" * 60)
+        LoggerSetup.stop_logging(self.logger)
 
 
 if __name__ == "__main__":
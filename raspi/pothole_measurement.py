@@ -12,7 +12,7 @@ Date: 2026-02-10
 """
 
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence, Union
 from dataclasses import dataclass
 import logging
 
@@ -28,7 +28,7 @@ class PotholeMeasurement:
     confidence: float  # 0-1
     sample_count: int
     duration: float  # seconds
-    depth_profile: List[float]  # All depth readings
+    depth_profile: Union[List[float], np.ndarray]  # All depth readings
 
 
 class PotholeAnalyzer:
@@ -63,7 +63,7 @@ class PotholeAnalyzer:
         
     def analyze_pothole(
         self,
-        depth_readings: List[float],
+        depth_readings: Union[Sequence[float], np.ndarray],
         duration: float,
         baseline_distance: Optional[float] = None
     ) -> PotholeMeasurement:
@@ -71,18 +71,18 @@ class PotholeAnalyzer:
         Analyze pothole dimensions from LiDAR readings.
         
         Args:
-            depth_readings: List of LiDAR distance readings (cm)
+            depth_readings: LiDAR distance readings (cm), list or ndarray
             duration: Duration of the pothole event (seconds)
             baseline_distance: Known road surface distance (cm). If None, estimated.
             
         Returns:
             PotholeMeasurement object with all dimensions
         """
-        if not depth_readings or len(depth_readings) < 3:
+        if depth_readings is None or len(depth_readings) < 3:
             raise ValueError("Insufficient readings for analysis (minimum 3 required)")
         
-        # Convert to numpy array for easier processing
-        readings = np.array(depth_readings)
+        # Convert to numpy array for easier processing (no copy if already float64)
+        readings = np.asarray(depth_readings, dtype=np.float64)
         
         # Step 1: Establish baseline (road surface level)
         if baseline_distance is None:
@@ -390,7 +390,7 @@ class PotholeAnalyzer:
 
 # Convenience function for quick analysis
 def measure_pothole(
-    depth_readings: List[float],
+    depth_readings: Union[Sequence[float], np.ndarray],
     duration: float,
     vehicle_speed: float = 30.0,
     sensor_height: float = 15.0
@@ -399,7 +399,7 @@ def measure_pothole(
     Quick pothole measurement function.
     
     Args:
-        depth_readings: List of LiDAR distance readings (cm)
+        depth_readings: LiDAR distance readings (cm), list or ndarray
         duration: Duration of pothole event (seconds)
         vehicle_speed: Vehicle speed (cm/s)
         sensor_height: Sensor height above road (cm)
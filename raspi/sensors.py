@@ -2,8 +2,12 @@
 """
 This module defines the sensor classes for the Pothole Detection System.
 """
+import multiprocessing
+import select
+import struct
 import time
 import threading
+from multiprocessing import shared_memory
 import serial
 try:
     from RPi import GPIO
@@ -23,6 +27,7 @@ except ImportError:
 
 import adafruit_gps
 from soft_serial import SoftwareSerial
+from _lidar_parse import FRAME_LEN, decode_frames
 
 GPIO.setwarnings(False)
 
@@ -44,6 +49,7 @@ class LiDAR:
         """
         self.ser = None
         self.dist = 0
+        self._rx = bytearray()  # undecoded bytes carried between read_batch() calls
 
         if port and not (tx and rx):
             try:
@@ -60,6 +66,47 @@ class LiDAR:
             except serial.SerialException as e:
                 print(f"LiDAR SW Init failed: {e}")
 
+    def wait_for_frame(self, timeout=0.02):
+        """
+        Blocks until serial data is available or the timeout elapses, so callers
+        sleep in the kernel instead of polling with time.sleep().
+
+        Args:
+            timeout (float, optional): Maximum wait in seconds. Defaults to 0.02.
+        """
+        if not isinstance(self.ser, serial.Serial):
+            time.sleep(timeout)
+            return
+        if self.ser.in_waiting >= 9:
+            return
+        try:
+            select.select([self.ser.fileno()], [], [], timeout)
+        except (AttributeError, OSError, ValueError):
+            # No selectable file descriptor (e.g. Windows); fall back to a short sleep
+            time.sleep(timeout)
+
+    def read_batch(self):
+        """
+        Drains everything queued on the UART in one read and decodes every
+        complete frame, so the serial driver is called once per batch instead
+        of once per frame. Blocks until at least one frame's worth of bytes
+        arrives (bounded by the port's read timeout).
+
+        Returns:
+            list: Distances in meters, oldest first (may be empty).
+        """
+        if not isinstance(self.ser, serial.Serial):
+            distance = self.get_distance()
+            return [] if distance is None else [distance]
+
+        try:
+            self._rx += self.ser.read(max(self.ser.in_waiting, FRAME_LEN))
+        except serial.SerialException:
+            return []
+        frames = decode_frames(self._rx)
+        # TF02-Pro max range is 12m; anything beyond is a spike
+        return [distance_cm / 100.0 for distance_cm, _ in frames if distance_cm <= 1200]
+
     def get_distance(self):
         """
         Reads the distance from the LiDAR sensor with Checksum validation 
@@ -252,3 +299,124 @@ class GPS:
     def stop(self):
         """Stops the GPS update thread."""
         self.running = False
+
+
+def _gps_process_main(port, shm_name, stop_event):
+    """Child-process entry point: runs a GPS reader and publishes fixes to shared memory."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    gps = GPS(port)
+    try:
+        # Tell the parent whether a GPS port was actually opened
+        state = SharedGPS.RUNNING if gps.gps else SharedGPS.FAILED
+        SharedGPS.STATE.pack_into(shm.buf, SharedGPS.STATE_OFFSET, state)
+        if state == SharedGPS.FAILED:
+            return
+        seq = 0
+        while not stop_event.wait(0.5):
+            data = gps.latest_data
+            # Seqlock: odd sequence while the record is being rewritten
+            seq += 1
+            SharedGPS.SEQ.pack_into(shm.buf, 0, seq)
+            SharedGPS.RECORD.pack_into(
+                shm.buf, SharedGPS.SEQ.size,
+                data['lat'], data['lon'], data['alt'] or 0.0, data['fixed']
+            )
+            seq += 1
+            SharedGPS.SEQ.pack_into(shm.buf, 0, seq)
+    finally:
+        gps.stop()
+        shm.close()
+
+
+class SharedGPS:
+    """
+    Runs the GPS reader in a separate process so NMEA parsing never competes
+    with the detection loop for the GIL. The latest fix is published through
+    shared memory; get_location() is a struct unpack, not a serial read.
+
+    The process is spawned, not forked: the parent already runs threads
+    (logging listener, workers) whose locks a forked child could inherit held.
+    """
+
+    SEQ = struct.Struct('Q')
+    RECORD = struct.Struct('ddd?')  # lat, lon, alt, fixed
+    STATE = struct.Struct('b')
+    STATE_OFFSET = SEQ.size + RECORD.size
+    STARTING, RUNNING, FAILED = 0, 1, -1
+    MAX_READ_RETRIES = 1000
+
+    def __init__(self, port=None):
+        """
+        Starts the GPS process.
+
+        Args:
+            port (str, optional): The serial port. Defaults to None (auto-detect).
+        """
+        self._shm = shared_memory.SharedMemory(create=True, size=self.STATE_OFFSET + self.STATE.size)
+        self.SEQ.pack_into(self._shm.buf, 0, 0)
+        self.RECORD.pack_into(self._shm.buf, self.SEQ.size, 0.0, 0.0, 0.0, False)
+        self.STATE.pack_into(self._shm.buf, self.STATE_OFFSET, self.STARTING)
+        ctx = multiprocessing.get_context('spawn')
+        self._stop_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_gps_process_main,
+            args=(port, self._shm.name, self._stop_event),
+            name="gps-reader",
+            daemon=True,
+        )
+        self._last = None
+        self._process.start()
+
+    def wait_ready(self, timeout=30.0):
+        """
+        Waits for the GPS process to report whether it opened a GPS port.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds. Defaults to 30
+                (the spawned child re-imports the main script and its dependencies).
+
+        Returns:
+            bool: True if the process is running with a GPS port open.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            (state,) = self.STATE.unpack_from(self._shm.buf, self.STATE_OFFSET)
+            if state != self.STARTING:
+                return state == self.RUNNING and self._process.is_alive()
+            if not self._process.is_alive() or time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
+    def get_location(self):
+        """
+        Returns the latest GPS data.
+
+        Returns:
+            dict: A dictionary containing the latitude, longitude, altitude, and
+            fix status; None if the GPS process has died. If no consistent read
+            succeeds within MAX_READ_RETRIES, the last good snapshot.
+        """
+        if not self._process.is_alive():
+            # A writer that died mid-update leaves the sequence odd forever
+            return None
+        buf = self._shm.buf
+        for _ in range(self.MAX_READ_RETRIES):
+            (seq,) = self.SEQ.unpack_from(buf, 0)
+            lat, lon, alt, fixed = self.RECORD.unpack_from(buf, self.SEQ.size)
+            # Retry if the writer was mid-update
+            if not seq & 1 and self.SEQ.unpack_from(buf, 0)[0] == seq:
+                self._last = {'lat': lat, 'lon': lon, 'alt': alt, 'fixed': fixed}
+                break
+        return self._last
+
+    def stop(self):
+        """Stops the GPS process and releases the shared memory."""
+        if self._process.is_alive():
+            # Only signal a live child: one killed inside Event.wait() can leave
+            # the event's condition in a state where set() blocks forever
+            self._stop_event.set()
+            self._process.join(timeout=2)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._shm.close()
+        self._shm.unlink()
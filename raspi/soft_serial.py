@@ -9,11 +9,15 @@ except ImportError:
         BCM = 11
         IN = 10
         OUT = 11
+        FALLING = 32
         def setmode(self, mode): pass
         def setwarnings(self, mode): pass
         def setup(self, pin, mode): pass
         def output(self, pin, state): pass
         def input(self, pin): return 0
+        def wait_for_edge(self, pin, edge, timeout=None):
+            time.sleep(timeout / 1000.0 if timeout else 0)
+            return None
     GPIO = MockGPIO()
     print("Warning: RPi.GPIO not found in raspi/soft_serial.py. Using a mock library.")
 
@@ -58,20 +62,26 @@ class SoftwareSerial:
     def read(self, count=1, timeout=1):
         """
         Blocking bit-bang read with timeout.
-        WARNING: This consumes 100% CPU waiting for start bit and is timing sensitive.
+        The wait for the start bit sleeps in the kernel on a GPIO edge
+        interrupt; only the byte itself is timing sensitive.
         """
         data = b''
         start_time = time.time()
         for _ in range(count):
-            # Wait for start bit (Low) with timeout
-            while GPIO.input(self.rx) == GPIO.HIGH:
-                if time.time() - start_time > timeout:
+            if GPIO.input(self.rx) == GPIO.HIGH:
+                # Wait for start bit (falling edge) with timeout, without spinning
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
                     return b'' # Timeout
-                pass
-            
-            # Align to end of start bit.
-            # Simple approach: Wait 1.5 bit times to sample first data bit
-            time.sleep(self.bit_time * 1.5)
+                if GPIO.wait_for_edge(self.rx, GPIO.FALLING, timeout=max(1, int(remaining * 1000))) is None:
+                    return b'' # Timeout
+                # The interrupt wakeup already used up part of the start bit,
+                # so one bit time lands near the middle of the first data bit
+                time.sleep(self.bit_time)
+            else:
+                # Align to end of start bit.
+                # Simple approach: Wait 1.5 bit times to sample first data bit
+                time.sleep(self.bit_time * 1.5)
             
             val = 0
             for i in range(8):
@@ -0,0 +1,30 @@
+import joblib
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+
+def export_onnx(model_path='pothole_sensor_model.pkl', onnx_path='pothole_sensor_model.onnx'):
+    """
+    Converts the trained Random Forest to ONNX so pi_inference.py can run it
+    with onnxruntime instead of scikit-learn.
+    """
+    try:
+        model = joblib.load(model_path)
+    except FileNotFoundError:
+        print("Model file not found. Run train_ml.py first.")
+        return
+
+    # Inputs: depth_mean, depth_max, depth_std, duration (float32)
+    # zipmap=False keeps the outputs as plain tensors instead of a list of dicts
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('X', FloatTensorType([None, 4]))],
+        options={id(model): {'zipmap': False}},
+        target_opset=17,
+    )
+    with open(onnx_path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    print(f"ONNX model saved as '{onnx_path}'")
+
+if __name__ == "__main__":
+    export_onnx()
@@ -1,36 +1,79 @@
+import os
 import joblib
 import numpy as np
 import time
 
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
 # Mocking the sensor reading logic for demonstration
 # In production, this would import your LiDAR class
 class SensorMLInference:
     def __init__(self, model_path='pothole_sensor_model.pkl'):
+        self.model = None
+        self._predict = None
+
+        # Prefer the ONNX export (see export_onnx.py) when onnxruntime is installed
+        onnx_path = os.path.splitext(model_path)[0] + '.onnx'
+        if ort is not None and os.path.exists(onnx_path):
+            try:
+                self._predict = self._load_onnx(onnx_path)
+                print(f"ONNX model loaded from {onnx_path}")
+                return
+            except Exception as e:
+                print(f"ONNX model failed to load ({e}), falling back to {model_path}")
+
         try:
             self.model = joblib.load(model_path)
             print(f"Model loaded from {model_path}")
         except:
             print("Model file not found. Ensure train_ml.py has been run.")
             self.model = None
+        # Bind the estimator's predict once instead of resolving it per event
+        self._predict = self.model.predict if self.model is not None else None
+        if self._predict is not None:
+            # Warm run so the first real event doesn't pay sklearn's first-call setup
+            self._predict(np.zeros((1, 4)))
+
+    @staticmethod
+    def _load_onnx(onnx_path):
+        """Returns a predict(features) callable backed by an onnxruntime session."""
+        session = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+        input_name = session.get_inputs()[0].name
+        label_name = session.get_outputs()[0].name
+
+        def predict(features):
+            return session.run([label_name], {input_name: features.astype(np.float32)})[0]
+
+        # Warm run so the first real event doesn't pay session initialisation
+        predict(np.zeros((1, 4)))
+        return predict
+
+    def classify_features(self, depth_mean, depth_max, depth_std, duration):
+        """
+        Classifies an event from precomputed features, skipping the feature
+        engineering step when the caller already has the statistics.
+        """
+        if self._predict is None:
+            return "Unknown"
+        features = np.array([[depth_mean, depth_max, depth_std, duration]], dtype=np.float64)
+        return self._predict(features)[0]
 
     def classify_event(self, depth_readings, duration):
         """
         Takes a list of depth readings from a single event (e.g., when depth > threshold)
         and classifies it using the ML model.
         """
-        if not self.model or not depth_readings:
+        if self._predict is None or len(depth_readings) == 0:
             return "Unknown"
 
         # 1. Feature Engineering (Convert raw sensor stream to ML features)
-        depth_mean = np.mean(depth_readings)
-        depth_max = np.max(depth_readings)
-        depth_std = np.std(depth_readings)
-        
-        features = np.array([[depth_mean, depth_max, depth_std, duration]])
+        readings = np.asarray(depth_readings, dtype=np.float64)
 
         # 2. Prediction
-        prediction = self.model.predict(features)
-        return prediction[0]
+        return self.classify_features(readings.mean(), readings.max(), readings.std(), duration)
 
 # --- Example Integration ---
 if __name__ == "__main__":
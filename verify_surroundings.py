@@ -16,8 +16,8 @@ def simulate_surroundings():
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS raw_data (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp REAL,
-            distance_cm REAL,
+            ts_ms INTEGER,
+            dist_mm INTEGER,
             strength INTEGER,
             session_id TEXT
         )
@@ -37,8 +37,8 @@ def simulate_surroundings():
             depth += random.uniform(-1, 1)
             
         cursor.execute(
-            "INSERT INTO raw_data (timestamp, distance_cm, strength, session_id) VALUES (?, ?, ?, ?)",
-            (time.time() + (i * 0.05), depth, 1500, session_id)
+            "INSERT INTO raw_data (ts_ms, dist_mm, strength, session_id) VALUES (?, ?, ?, ?)",
+            (int((time.time() + (i * 0.05)) * 1000), round(depth * 10), 1500, session_id)
         )
         conn.commit()
     